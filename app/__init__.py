@@ -1,11 +1,11 @@
 from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 import os
 from dotenv import load_dotenv
+from .replicas import RoutingSQLAlchemy, ReplicaSet
 
 
-db = SQLAlchemy()
+db = RoutingSQLAlchemy()
 migrate = Migrate()
 load_dotenv()
 
@@ -21,16 +21,116 @@ def create_app(test_config=None):
         app.config["TESTING"] = True
         app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get(
             "SQLALCHEMY_TEST_DATABASE_URI")
+        # never post to a real workspace from tests unless asked to
+        app.config["SLACK_BOT_TOKEN"] = None
+        app.config.update(test_config)
+
+    # Read replicas for GET requests on blueprints that opt in; a
+    # comma-separated list in the environment
+    app.config.setdefault("SQLALCHEMY_REPLICA_URIS", [
+        uri for uri in os.environ.get("SQLALCHEMY_REPLICA_URIS", "").split(",") if uri])
+    # seconds a replica may lag the primary before reads skip it
+    app.config.setdefault("SQLALCHEMY_REPLICA_MAX_LAG", float(
+        os.environ.get("SQLALCHEMY_REPLICA_MAX_LAG", 5)))
+    app.config.setdefault("SQLALCHEMY_REPLICA_LAG_CHECK_INTERVAL", float(
+        os.environ.get("SQLALCHEMY_REPLICA_LAG_CHECK_INTERVAL", 1)))
+    replica_binds = {
+        f"replica_{number}": uri
+        for number, uri in enumerate(app.config["SQLALCHEMY_REPLICA_URIS"])}
+    app.config.setdefault("SQLALCHEMY_BINDS", {})
+    app.config["SQLALCHEMY_BINDS"].update(replica_binds)
+
+    # Connection pool tuning, see app/pool.py for the environment variables
+    from .pool import engine_options
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(
+        app.config["SQLALCHEMY_DATABASE_URI"]))
+
+    # Cache for GET /tasks/<id>; a size of 0 disables it
+    app.config.setdefault("TASK_CACHE_SIZE", int(
+        os.environ.get("TASK_CACHE_SIZE", 0)))
+    app.config.setdefault("TASK_CACHE_TTL", float(
+        os.environ.get("TASK_CACHE_TTL", 30)))
+
+    # Keep per-goal task counters on the goal row instead of aggregating
+    # tasks on every GET /goals?progress=true
+    app.config.setdefault("GOAL_PROGRESS_COUNTERS", os.environ.get(
+        "GOAL_PROGRESS_COUNTERS", "false").lower() in ("1", "true"))
+
+    # Slack notifications for completed tasks; disabled without a token
+    app.config.setdefault("SLACK_BOT_TOKEN", os.environ.get("SLACK_BOT_TOKEN"))
+    app.config.setdefault("SLACK_CHANNEL", os.environ.get(
+        "SLACK_CHANNEL", "task-notifications"))
+    app.config.setdefault("SLACK_API_URL", os.environ.get(
+        "SLACK_API_URL", "https://slack.com/api/chat.postMessage"))
+    app.config.setdefault("NOTIFY_QUEUE_SIZE", int(
+        os.environ.get("NOTIFY_QUEUE_SIZE", 1000)))
+    app.config.setdefault("NOTIFY_WORKERS", int(
+        os.environ.get("NOTIFY_WORKERS", 2)))
+    app.config.setdefault("NOTIFY_BATCH_SIZE", int(
+        os.environ.get("NOTIFY_BATCH_SIZE", 10)))
+    app.config.setdefault("NOTIFY_MAX_RETRIES", int(
+        os.environ.get("NOTIFY_MAX_RETRIES", 3)))
+    app.config.setdefault("NOTIFY_RETRY_BACKOFF", float(
+        os.environ.get("NOTIFY_RETRY_BACKOFF", 0.5)))
+    app.config.setdefault("NOTIFY_OVERFLOW", os.environ.get(
+        "NOTIFY_OVERFLOW", "drop"))
+
+    # Write completion events to the outbox table for `flask outbox relay`
+    # instead of notifying Slack from the web process
+    app.config.setdefault("OUTBOX_ENABLED", os.environ.get(
+        "OUTBOX_ENABLED", "false").lower() in ("1", "true"))
+    app.config.setdefault("OUTBOX_MAX_ATTEMPTS", int(
+        os.environ.get("OUTBOX_MAX_ATTEMPTS", 10)))
+
+    # Request, status code and SQL metrics served from /metrics
+    app.config.setdefault("METRICS_ENABLED", os.environ.get(
+        "METRICS_ENABLED", "true").lower() in ("1", "true"))
+
+    # Response JSON encoder: auto, orjson or stdlib, see app/json_backend.py
+    app.config.setdefault("JSON_BACKEND", os.environ.get("JSON_BACKEND", "auto"))
+    from .json_backend import json_encoder
+    app.json_encoder = json_encoder(app.config["JSON_BACKEND"])
 
     # Import models here for Alembic setup
     from app.models.task import Task
     from app.models.goal import Goal
+    from app.models.change_counter import ChangeCounter
+    from app.models.outbox_event import OutboxEvent
+    from app.models.deleted_task import DeletedTask
+    # full-text search indexes are created alongside the task table
+    from .search import include_object
 
     db.init_app(app)
-    migrate.init_app(app, db)
+    migrate.init_app(app, db, include_object=include_object)
+
+    app.extensions["replicas"] = ReplicaSet(
+        db, app, list(replica_binds),
+        app.config["SQLALCHEMY_REPLICA_MAX_LAG"],
+        app.config["SQLALCHEMY_REPLICA_LAG_CHECK_INTERVAL"])
+
+    from .cache import TaskCache
+    app.extensions["task_cache"] = TaskCache(
+        app.config["TASK_CACHE_SIZE"], app.config["TASK_CACHE_TTL"])
+
+    from .notifications import SlackNotifier
+    app.extensions["notifier"] = SlackNotifier.from_config(app.config)
+
+    if app.config["METRICS_ENABLED"]:
+        from .metrics import RequestMetrics
+        app.extensions["request_metrics"] = RequestMetrics()
+        app.extensions["request_metrics"].init_app(app)
 
     # Register Blueprints here
     from .routes import tasks_bp
     app.register_blueprint(tasks_bp)
 
+    from .goal_routes import goals_bp
+    app.register_blueprint(goals_bp)
+
+    from .metrics_routes import metrics_bp
+    app.register_blueprint(metrics_bp)
+
+    from .outbox import outbox_cli
+    app.cli.add_command(outbox_cli)
+
     return app
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from threading import Lock
+import time
+
+
+class TaskCache:
+    # Bounded LRU cache with a per-entry TTL for serialized tasks, keyed by
+    # task_id. Each worker process has its own cache: writes invalidate the
+    # local copy only, so the TTL bounds how stale other workers can be.
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self):
+        return self.max_size > 0
+
+    def get(self, task_id):
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(task_id)
+                    self.hits += 1
+                    return value
+                del self._entries[task_id]
+            self.misses += 1
+            return None
+
+    def set(self, task_id, value):
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[task_id] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(task_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *task_ids):
+        with self._lock:
+            for task_id in task_ids:
+                self._entries.pop(task_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -0,0 +1,49 @@
+from flask import current_app
+from sqlalchemy import func, select
+
+from app import db
+from app.models.goal import Goal
+from app.models.task import Task
+
+
+# Goal progress ("N of M tasks complete") can come from two places:
+# an aggregate over task computed on read, or the task_count and
+# completed_count columns on goal, kept current by every write that can
+# change them when GOAL_PROGRESS_COUNTERS is enabled.
+def counters_enabled():
+    return current_app.config["GOAL_PROGRESS_COUNTERS"]
+
+def goal_progress_query():
+    if counters_enabled():
+        return db.session.query(
+            Goal.goal_id, Goal.title, Goal.task_count, Goal.completed_count)
+
+    # count(completed_at) only counts the non-null, i.e. completed, tasks
+    return db.session.query(
+        Goal.goal_id,
+        Goal.title,
+        func.count(Task.task_id).label("task_count"),
+        func.count(Task.completed_at).label("completed_count")
+    ).outerjoin(Task, Task.goal_id == Goal.goal_id).group_by(Goal.goal_id, Goal.title)
+
+def refresh_goal_counters(goal_ids):
+    # called by every write that can change a goal's progress; must run
+    # inside the writing transaction
+    if counters_enabled():
+        recount_goals(goal_ids)
+
+def recount_goals(goal_ids):
+    # recounts from task rather than applying deltas, so callers don't need
+    # to know a task's previous state; each recount is an index range scan
+    # on task.goal_id
+    goal_ids = {goal_id for goal_id in goal_ids if goal_id is not None}
+    if not goal_ids:
+        return
+
+    goal = Goal.__table__
+    task = Task.__table__
+    tasks_of_goal = task.c.goal_id == goal.c.goal_id
+    db.session.execute(goal.update().where(goal.c.goal_id.in_(goal_ids)).values(
+        task_count=select([func.count(task.c.task_id)]).where(tasks_of_goal).as_scalar(),
+        completed_count=select([func.count(task.c.completed_at)]).where(tasks_of_goal).as_scalar()
+    ))
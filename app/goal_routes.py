@@ -0,0 +1,163 @@
+from flask import Blueprint, jsonify, request, make_response, abort
+
+from app import db
+from app.models.goal import Goal
+from app.models.task import Task
+from app.routes import task_dictionary, validate_task_ids, next_list_version, task_cache
+from app.goal_progress import (goal_progress_query, refresh_goal_counters,
+                               recount_goals, counters_enabled)
+
+goals_bp = Blueprint("goals", __name__, url_prefix="/goals")
+
+# helper functions to organize the code
+def goal_dictionary(goal):
+    return {
+        "goal": {
+            "id": goal.goal_id,
+            "title": goal.title
+        }
+    }
+
+def goal_progress_dictionary(goal):
+    return {
+        "id": goal.goal_id,
+        "title": goal.title,
+        "task_count": goal.task_count,
+        "completed_count": goal.completed_count
+    }
+
+def validate_goal_id(goal_id):
+    try:
+        return int(goal_id)
+    except:
+        abort(make_response({"details": f"Invalid goal id '{goal_id}'. Goal id expected to be a number."}, 400))
+
+def validate_goal(goal_id, query=None):
+    goal_id = validate_goal_id(goal_id)
+
+    if query is None:
+        query = Goal.query
+    goal = query.get(goal_id)
+
+    if not goal:
+        abort(make_response({"details": f"No goal with id '{goal_id}' found."}, 404))
+
+    return goal
+
+# moves tasks between goals with one UPDATE instead of loading and
+# appending each task; bumps task versions so their ETags change, and the
+# task list version.
+def assign_tasks(goal_id, task_ids):
+    previous_goal_ids = set()
+    if counters_enabled():
+        previous_goal_ids = {previous for previous, in db.session.query(
+            Task.goal_id).filter(Task.task_id.in_(task_ids)).distinct()}
+
+    table = Task.__table__
+    statement = table.update().where(table.c.task_id.in_(task_ids)).values(
+        goal_id=goal_id, version=table.c.version + 1, list_version=next_list_version())
+    rowcount = db.session.execute(statement).rowcount
+
+    refresh_goal_counters(previous_goal_ids | {goal_id})
+    return rowcount
+
+# code to execute routes
+@goals_bp.route("", methods=["POST"])
+def create_goal():
+    request_body = request.get_json()
+
+    if "title" not in request_body:
+        return jsonify({"details": "Invalid data"}), 400
+
+    new_goal = Goal(title=request_body["title"])
+    db.session.add(new_goal)
+    db.session.commit()
+
+    return goal_dictionary(new_goal), 201
+
+@goals_bp.route("", methods=["GET"])
+def get_all_goals():
+    # ?progress=true adds task_count and completed_count for every goal,
+    # computed for all goals at once rather than by loading goal.tasks
+    if request.args.get("progress") in ("1", "true"):
+        goals = goal_progress_query().order_by(Goal.goal_id).all()
+        return jsonify([goal_progress_dictionary(goal) for goal in goals]), 200
+
+    goals = db.session.query(Goal.goal_id, Goal.title).order_by(Goal.goal_id).all()
+
+    response = [goal_dictionary(goal)["goal"] for goal in goals]
+    return jsonify(response), 200
+
+@goals_bp.route("/<goal_id>", methods=["GET"])
+def get_one_goal(goal_id):
+    goal = validate_goal(goal_id)
+    return goal_dictionary(goal), 200
+
+@goals_bp.route("/<goal_id>", methods=["PUT"])
+def update_one_goal(goal_id):
+    goal = validate_goal(goal_id)
+    request_body = request.get_json()
+
+    if "title" not in request_body:
+        return jsonify({"details": "Invalid data"}), 400
+
+    goal.title = request_body["title"]
+    db.session.commit()
+
+    return goal_dictionary(goal), 200
+
+@goals_bp.route("/<goal_id>", methods=["DELETE"])
+def delete_goal(goal_id):
+    goal = validate_goal(goal_id)
+
+    # tasks outlive their goal; detach them in one statement first
+    task_ids = [task_id for task_id, in db.session.query(Task.task_id).filter(
+        Task.goal_id == goal.goal_id)]
+    if task_ids:
+        assign_tasks(None, task_ids)
+
+    db.session.delete(goal)
+    db.session.commit()
+    task_cache().invalidate(*task_ids)
+
+    return make_response(jsonify({"details": f'Goal {goal_id} "{goal.title}" successfully deleted'}), 200)
+
+@goals_bp.route("/<goal_id>/tasks", methods=["POST"])
+def assign_tasks_to_goal(goal_id):
+    goal_id = validate_goal_id(goal_id)
+    request_body = request.get_json()
+    if not isinstance(request_body, dict):
+        abort(make_response({"details": "Request body must include task_ids"}, 400))
+    task_ids = validate_task_ids(request_body.get("task_ids"))
+
+    if not db.session.query(Goal.query.filter(Goal.goal_id == goal_id).exists()).scalar():
+        abort(make_response({"details": f"No goal with id '{goal_id}' found."}, 404))
+
+    if assign_tasks(goal_id, task_ids) != len(set(task_ids)):
+        db.session.rollback()
+        existing = {task_id for task_id, in db.session.query(Task.task_id).filter(
+            Task.task_id.in_(task_ids))}
+        missing = [task_id for task_id in task_ids if task_id not in existing]
+        abort(make_response({"details": f"No task with id '{missing[0]}' found."}, 404))
+
+    db.session.commit()
+    task_cache().invalidate(*task_ids)
+
+    return jsonify({"id": goal_id, "task_ids": task_ids}), 200
+
+@goals_bp.route("/<goal_id>/tasks", methods=["GET"])
+def get_tasks_for_goal(goal_id):
+    # load the goal and all of its tasks in a single joined query
+    goal = validate_goal(goal_id, Goal.query.options(db.joinedload(Goal.tasks)))
+
+    return jsonify({
+        "id": goal.goal_id,
+        "title": goal.title,
+        "tasks": [task_dictionary(task)["task"] for task in goal.tasks]
+    }), 200
+
+@goals_bp.cli.command("refresh-counters")
+def refresh_counters_command():
+    """Recount task_count and completed_count for every goal."""
+    recount_goals(goal_id for goal_id, in db.session.query(Goal.goal_id))
+    db.session.commit()
@@ -0,0 +1,37 @@
+# Cooperative (gevent) serving support. Flask 1.1 and SQLAlchemy 1.3 have
+# no async views or async engine, so the async deployment mode runs the
+# same WSGI app on gevent workers instead: every request is a greenlet and
+# a worker process parks thousands of them on network I/O. psycopg2 is a C
+# extension that gevent's monkey patching can't reach, so it also needs a
+# wait callback that yields to the event loop while Postgres answers.
+
+
+def patch_psycopg2():
+    try:
+        from gevent.socket import wait_read, wait_write
+    except ImportError:
+        raise RuntimeError(
+            "The gevent serving mode needs gevent; pip install -r requirements-async.txt")
+
+    from psycopg2 import extensions, OperationalError
+
+    def gevent_wait_callback(conn, timeout=None):
+        while True:
+            state = conn.poll()
+            if state == extensions.POLL_OK:
+                return
+            elif state == extensions.POLL_READ:
+                wait_read(conn.fileno(), timeout=timeout)
+            elif state == extensions.POLL_WRITE:
+                wait_write(conn.fileno(), timeout=timeout)
+            else:
+                raise OperationalError(f"Bad result from poll: {state!r}")
+
+    extensions.set_wait_callback(gevent_wait_callback)
+
+
+def patch_all():
+    # must run before anything else imports socket, ssl or threading
+    from gevent import monkey
+    monkey.patch_all()
+    patch_psycopg2()
@@ -0,0 +1,66 @@
+from datetime import date, datetime, timezone
+
+from flask.json import JSONEncoder
+
+# JSON encoding for every response. Flask 1.1 has no pluggable JSON
+# provider, but jsonify and flask.json.dumps build app.json_encoder and
+# call its encode(), so a subclass can hand the whole document to a
+# faster library. JSON_BACKEND picks one:
+#
+# - "orjson": orjson, about an order of magnitude faster on task lists
+#   (pip install orjson)
+# - "stdlib": the json module
+# - "auto": orjson when it is installed, otherwise the json module
+#
+# Both write datetimes as ISO 8601, with naive values taken to be UTC as
+# they are stored, e.g. "2022-05-01T09:30:00+00:00".
+JSON_BACKENDS = ("auto", "orjson", "stdlib")
+
+
+def datetime_isoformat(value):
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+class StdlibJSONEncoder(JSONEncoder):
+    def default(self, o):
+        if isinstance(o, datetime):
+            return datetime_isoformat(o)
+        if isinstance(o, date):
+            return o.isoformat()
+        return super().default(o)
+
+
+def orjson_encoder():
+    import orjson
+
+    class OrjsonJSONEncoder(StdlibJSONEncoder):
+        def encode(self, o):
+            option = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if self.indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(o, default=self.default, option=option).decode()
+            except orjson.JSONEncodeError:
+                # integers beyond 64 bits and the like
+                return super().encode(o)
+
+    return OrjsonJSONEncoder
+
+
+def json_encoder(backend):
+    if backend not in JSON_BACKENDS:
+        raise RuntimeError(
+            f"Unknown JSON_BACKEND '{backend}'. Expected one of {', '.join(JSON_BACKENDS)}.")
+
+    if backend == "stdlib":
+        return StdlibJSONEncoder
+    try:
+        return orjson_encoder()
+    except ImportError:
+        if backend == "orjson":
+            raise RuntimeError("JSON_BACKEND=orjson needs orjson; pip install orjson")
+        return StdlibJSONEncoder
@@ -0,0 +1,175 @@
+from bisect import bisect_left
+from threading import Lock
+import time
+
+from flask import g, request, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+        self._lock = Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{format_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # per label set: one count per bucket (non-cumulative), +Inf, sum
+        self._values = {}
+        self._lock = Lock()
+
+    def observe(self, labels, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labels)
+            if series is None:
+                series = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, list(series)) for labels, series in self._values.items())
+        for labels, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), series):
+                cumulative += count
+                bucket_labels = format_labels(self.label_names + ("le",), labels + (str(bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            label_text = format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {series[-1]}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def format_labels(names, values):
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+class RequestMetrics:
+    # Per-route request latency, request counts by status and per-request
+    # SQL statement counts and time, collected with Flask request hooks and
+    # SQLAlchemy cursor events. Routes are labelled by URL rule, not path,
+    # so label cardinality stays bounded. Streamed responses are timed up to
+    # the point the view returns, not until the last chunk is sent.
+    def __init__(self):
+        self.request_seconds = Histogram(
+            "http_request_duration_seconds", "Time spent handling a request.",
+            ("method", "route"), LATENCY_BUCKETS)
+        self.requests = Counter(
+            "http_requests_total", "Requests handled, by status code.",
+            ("method", "route", "status"))
+        self.sql_statements = Histogram(
+            "http_request_sql_statements", "SQL statements executed per request.",
+            ("method", "route"), STATEMENT_BUCKETS)
+        self.sql_seconds = Histogram(
+            "http_request_sql_duration_seconds", "Time spent in SQL per request.",
+            ("method", "route"), LATENCY_BUCKETS)
+
+    def init_app(self, app):
+        app.before_request(self.start_request)
+        app.after_request(self.finish_request)
+        app.teardown_request(self.teardown_request)
+        listen_for_sql()
+
+    def start_request(self):
+        g.metrics_start = time.perf_counter()
+        g.sql_statements = 0
+        g.sql_seconds = 0.0
+
+    def finish_request(self, response):
+        self.record(response.status_code)
+        return response
+
+    def teardown_request(self, error):
+        # after_request is skipped when a view raises; count those as 500s
+        if g.get("metrics_start") is not None:
+            self.record(500)
+
+    def record(self, status):
+        start = g.pop("metrics_start", None)
+        if start is None:
+            return
+        labels = (request.method, route_label())
+        self.request_seconds.observe(labels, time.perf_counter() - start)
+        self.requests.inc(labels + (str(status),))
+        self.sql_statements.observe(labels, g.sql_statements)
+        self.sql_seconds.observe(labels, g.sql_seconds)
+
+    def render(self):
+        lines = []
+        for metric in (self.request_seconds, self.requests,
+                       self.sql_statements, self.sql_seconds):
+            lines.extend(metric.render())
+        return lines
+
+
+def route_label():
+    if request.url_rule is None:
+        return "unmatched"
+    return request.url_rule.rule
+
+
+def listen_for_sql():
+    # registered once per process on Engine, so primary and replica
+    # engines of every app are covered
+    if not event.contains(Engine, "before_cursor_execute", before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", after_cursor_execute)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info["query_start"] = time.perf_counter()
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info.pop("query_start", time.perf_counter())
+    if has_request_context() and "sql_statements" in g:
+        g.sql_statements += 1
+        g.sql_seconds += elapsed
+
+
+def gauge_lines(name, help_text, samples):
+    return sample_lines(name, help_text, "gauge", samples)
+
+
+# for totals kept elsewhere (pool, cache and notifier stats) that only
+# ever go up until the process restarts
+def counter_lines(name, help_text, samples):
+    return sample_lines(name, help_text, "counter", samples)
+
+
+def sample_lines(name, help_text, metric_type, samples):
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        lines.append(f"{name}{format_labels(tuple(labels), tuple(labels.values()))} {value}")
+    return lines
@@ -0,0 +1,63 @@
+from flask import Blueprint, jsonify, current_app, make_response
+
+from app import db
+from app.metrics import counter_lines, gauge_lines
+from app.pool import pool_stats
+
+metrics_bp = Blueprint("metrics", __name__, url_prefix="/metrics")
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# helper functions to organize the code
+def database_pools():
+    pools = [("primary", db.engine.pool)]
+    for number, engine in enumerate(current_app.extensions["replicas"].engines()):
+        pools.append((f"replica_{number}", engine.pool))
+    return [(name, pool_stats(pool)) for name, pool in pools]
+
+def pool_metric_lines():
+    lines = []
+    pools = database_pools()
+    for key, name, help_text, metric_lines in (
+            ("checked_out", "db_pool_checked_out", "Connections currently checked out.", gauge_lines),
+            ("overflow", "db_pool_overflow", "Connections open beyond pool_size.", gauge_lines),
+            ("size", "db_pool_size", "Configured pool_size.", gauge_lines),
+            ("checkouts", "db_pool_checkouts_total", "Connection checkouts.", counter_lines),
+            ("timeouts", "db_pool_timeouts_total", "Checkouts that timed out waiting.", counter_lines),
+            ("wait_seconds_total", "db_pool_wait_seconds_total", "Time spent waiting for a connection.", counter_lines)):
+        samples = [({"database": database}, stats[key])
+                   for database, stats in pools if key in stats]
+        if samples:
+            lines.extend(metric_lines(name, help_text, samples))
+    return lines
+
+# code to execute routes
+@metrics_bp.route("", methods=["GET"])
+def get_metrics():
+    lines = []
+    request_metrics = current_app.extensions.get("request_metrics")
+    if request_metrics is not None:
+        lines.extend(request_metrics.render())
+    lines.extend(pool_metric_lines())
+
+    cache = current_app.extensions["task_cache"].stats()
+    lines.extend(counter_lines("task_cache_hits_total", "Task cache hits.", [({}, cache["hits"])]))
+    lines.extend(counter_lines("task_cache_misses_total", "Task cache misses.", [({}, cache["misses"])]))
+
+    notifications = current_app.extensions["notifier"].stats()
+    lines.extend(counter_lines("notifications_total", "Slack notifications by outcome.", [
+        ({"outcome": outcome}, notifications[outcome])
+        for outcome in ("sent", "failed", "dropped", "retried")]))
+
+    response = make_response("\n".join(lines) + "\n", 200)
+    response.headers["Content-Type"] = PROMETHEUS_CONTENT_TYPE
+    return response
+
+@metrics_bp.route("/pool", methods=["GET"])
+def get_pool_metrics():
+    return jsonify({
+        "database": pool_stats(db.engine.pool),
+        "replicas": [pool_stats(engine.pool)
+                     for engine in current_app.extensions["replicas"].engines()],
+        "task_cache": current_app.extensions["task_cache"].stats()
+    }), 200
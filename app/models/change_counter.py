@@ -0,0 +1,8 @@
+from app import db
+
+
+class ChangeCounter(db.Model):
+    # one row per table, bumped in the same transaction as every write
+    # made through the API; used to build ETags for list endpoints
+    name = db.Column(db.String, primary_key=True)
+    value = db.Column(db.BigInteger, nullable=False, default=0)
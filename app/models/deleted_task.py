@@ -0,0 +1,10 @@
+from app import db
+
+
+class DeletedTask(db.Model):
+    # one row per deleted task, stamped like Task.list_version, so
+    # GET /tasks/changes can tell clients which cached tasks to drop.
+    # Keyed by its own id: SQLite may hand a deleted task id out again.
+    id = db.Column(db.Integer, primary_key=True)
+    task_id = db.Column(db.Integer, nullable=False)
+    list_version = db.Column(db.BigInteger, nullable=False, index=True)
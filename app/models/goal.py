@@ -3,3 +3,9 @@ from app import db
 
 class Goal(db.Model):
     goal_id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String)
+    # materialized progress, only maintained when GOAL_PROGRESS_COUNTERS is on
+    task_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    completed_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    tasks = db.relationship("Task", back_populates="goal", lazy=True,
+                            order_by="Task.task_id")
@@ -0,0 +1,22 @@
+from app import db
+from datetime import datetime
+
+
+class OutboxEvent(db.Model):
+    # events written in the same transaction as the change they describe
+    # and delivered later by `flask outbox relay`
+    __tablename__ = "outbox"
+
+    id = db.Column(db.Integer, primary_key=True)
+    event_type = db.Column(db.String, nullable=False)
+    payload = db.Column(db.JSON, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime, nullable=True)
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # relays only ever scan undelivered events
+        db.Index("ix_outbox_pending", "id",
+                 postgresql_where=db.text("sent_at IS NULL"),
+                 sqlite_where=db.text("sent_at IS NULL")),
+    )
@@ -1,3 +1,5 @@
+from sqlalchemy import DDL, event
+
 from app import db
 
 
@@ -6,3 +8,32 @@ class Task(db.Model):
     title = db.Column(db.String)
     description = db.Column(db.String)
     completed_at = db.Column(db.DateTime, nullable=True)
+    # bumped on every write, used for the task's ETag
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    # value of the "task" change counter when the task last changed;
+    # GET /tasks/changes?since= returns tasks stamped after a version
+    list_version = db.Column(db.BigInteger, nullable=False, default=0,
+                             server_default="0", index=True)
+    goal_id = db.Column(db.Integer, db.ForeignKey("goal.goal_id"),
+                        nullable=True, index=True)
+    goal = db.relationship("Goal", back_populates="tasks")
+
+    __table_args__ = (
+        # serves ?sort=asc|desc and keyset pagination on (title, task_id)
+        db.Index("ix_task_title_task_id", "title", "task_id"),
+        # only incomplete tasks are indexed, keeping the index small
+        db.Index("ix_task_incomplete", "task_id",
+                 postgresql_where=db.text("completed_at IS NULL"),
+                 sqlite_where=db.text("completed_at IS NULL")),
+    )
+
+
+# ?title_prefix= runs LIKE 'prefix%' on PostgreSQL, which a btree index
+# only serves with text_pattern_ops unless the database uses the "C"
+# collation. SQLite filters on a title range that ix_task_title_task_id
+# already serves, so this index is created on PostgreSQL only.
+TITLE_PATTERN_INDEX = "ix_task_title_pattern"
+
+event.listen(Task.__table__, "after_create", DDL(
+    f"CREATE INDEX IF NOT EXISTS {TITLE_PATTERN_INDEX} ON task (title text_pattern_ops)"
+).execute_if(dialect="postgresql"))
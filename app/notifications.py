@@ -0,0 +1,181 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+def completion_message(title):
+    return f"Someone just completed the task {title}"
+
+
+class SlackNotifier:
+    # Sends Slack messages off the request path. Routes call notify() after
+    # their commit; messages wait in a bounded queue and worker threads post
+    # them in batches (several notifications joined into one message), with
+    # exponential backoff on network errors, 5xx and rate limiting.
+    #
+    # When the queue is full the overflow policy decides: "drop" discards
+    # the new message right away, "block" waits up to block_timeout for
+    # space before dropping it. Notifications still queued when the process
+    # dies are lost; enable OUTBOX_ENABLED for delivery that survives crashes.
+    def __init__(self, token, channel, api_url, queue_size=1000, workers=2,
+                 batch_size=10, max_retries=3, retry_backoff=0.5,
+                 overflow="drop", block_timeout=1.0, request_timeout=5.0):
+        self.token = token
+        self.channel = channel
+        self.api_url = api_url
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.request_timeout = request_timeout
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self.retried = 0
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._session = None
+        self._threads = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config):
+        return cls(
+            token=config["SLACK_BOT_TOKEN"],
+            channel=config["SLACK_CHANNEL"],
+            api_url=config["SLACK_API_URL"],
+            queue_size=config["NOTIFY_QUEUE_SIZE"],
+            workers=config["NOTIFY_WORKERS"],
+            batch_size=config["NOTIFY_BATCH_SIZE"],
+            max_retries=config["NOTIFY_MAX_RETRIES"],
+            retry_backoff=config["NOTIFY_RETRY_BACKOFF"],
+            overflow=config["NOTIFY_OVERFLOW"],
+        )
+
+    @property
+    def enabled(self):
+        return bool(self.token)
+
+    def notify(self, text):
+        if not self.enabled:
+            return False
+        self._start()
+
+        try:
+            if self.overflow == "block":
+                self._queue.put(text, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(text)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.warning("Notification queue full, dropped: %s", text)
+            return False
+        return True
+
+    def send(self, text):
+        # delivers right away on the calling thread, with the same retry
+        # policy the workers use
+        if not self.enabled:
+            return False
+        if self._session is None:
+            self._session = requests.Session()
+        return self._send(self._session, text)
+
+    def flush(self, timeout=None):
+        # waits until every queued notification has been handled
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "sent": self.sent,
+                "failed": self.failed,
+                "dropped": self.dropped,
+                "retried": self.retried
+            }
+
+    def _start(self):
+        # threads start on first use so forked gunicorn workers each get
+        # their own instead of inheriting dead ones from the master
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(
+                    target=self._run, name=f"slack-notifier-{number}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            atexit.register(self.flush, 2.0)
+
+    def _run(self):
+        session = requests.Session()
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                delivered = self._send(session, "\n".join(batch))
+            except Exception:
+                logger.exception("Unexpected error sending notification")
+                delivered = False
+
+            with self._lock:
+                if delivered:
+                    self.sent += len(batch)
+                else:
+                    self.failed += len(batch)
+            for _ in batch:
+                self._queue.task_done()
+
+    def _send(self, session, text):
+        for attempt in range(self.max_retries + 1):
+            delay = self.retry_backoff * 2 ** attempt
+            try:
+                response = session.post(
+                    self.api_url,
+                    headers={"Authorization": f"Bearer {self.token}"},
+                    json={"channel": self.channel, "text": text},
+                    timeout=self.request_timeout)
+            except requests.RequestException as error:
+                logger.warning("Slack request failed: %s", error)
+            else:
+                if response.status_code == 429:
+                    delay = float(response.headers.get("Retry-After", delay))
+                elif response.status_code < 500:
+                    try:
+                        body = response.json() if response.content else {}
+                    except ValueError:
+                        # an error page from a proxy in front of Slack, say
+                        logger.error("Slack sent a response that is not JSON: %s", response.status_code)
+                        return False
+                    if response.ok and body.get("ok", True):
+                        return True
+                    # errors such as an invalid token won't fix themselves
+                    logger.error("Slack rejected notification: %s", body.get("error", response.status_code))
+                    return False
+
+            if attempt < self.max_retries:
+                with self._lock:
+                    self.retried += 1
+                time.sleep(delay)
+        return False
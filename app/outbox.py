@@ -0,0 +1,78 @@
+import time
+from datetime import datetime
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from app import db
+from app.models.outbox_event import OutboxEvent
+from app.notifications import completion_message
+
+TASK_COMPLETED = "task.completed"
+
+outbox_cli = AppGroup("outbox", help="Deliver events from the outbox table.")
+
+
+def outbox_enabled():
+    return current_app.config["OUTBOX_ENABLED"]
+
+def record_completions(tasks):
+    # must run inside the transaction that sets completed_at, so the
+    # events commit (or roll back) together with the change
+    if not outbox_enabled():
+        return
+    rows = [{
+        "event_type": TASK_COMPLETED,
+        "payload": {"task_id": task.task_id, "title": task.title},
+        "created_at": datetime.utcnow(),
+        "attempts": 0
+    } for task in tasks]
+    if rows:
+        db.session.execute(OutboxEvent.__table__.insert(), rows)
+
+def relay_batch(notifier, batch_size):
+    # FOR UPDATE SKIP LOCKED lets several relays run side by side: each
+    # claims a different batch and none waits on or resends another's rows.
+    # The locks are held until the batch is marked sent and committed.
+    max_attempts = current_app.config["OUTBOX_MAX_ATTEMPTS"]
+    events = OutboxEvent.query.filter(
+        OutboxEvent.sent_at.is_(None),
+        OutboxEvent.attempts < max_attempts
+    ).order_by(OutboxEvent.id).limit(batch_size).with_for_update(skip_locked=True).all()
+
+    if not events:
+        db.session.commit()
+        return 0
+
+    text = "\n".join(completion_message(event.payload["title"]) for event in events)
+    delivered = notifier.send(text)
+
+    for event in events:
+        event.attempts += 1
+        if delivered:
+            event.sent_at = datetime.utcnow()
+    db.session.commit()
+    return len(events) if delivered else 0
+
+
+@outbox_cli.command("relay")
+@click.option("--batch-size", default=100, show_default=True,
+              help="Events claimed and sent per transaction.")
+@click.option("--interval", default=1.0, show_default=True,
+              help="Seconds to sleep when the outbox is empty.")
+@click.option("--once", is_flag=True, help="Drain the outbox and exit.")
+def relay_command(batch_size, interval, once):
+    """Send pending outbox events to Slack."""
+    notifier = current_app.extensions["notifier"]
+    if not notifier.enabled:
+        raise click.ClickException("SLACK_BOT_TOKEN is not set")
+
+    while True:
+        sent = relay_batch(notifier, batch_size)
+        if sent:
+            click.echo(f"Relayed {sent} events")
+        elif once:
+            return
+        else:
+            time.sleep(interval)
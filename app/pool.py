@@ -0,0 +1,84 @@
+from threading import Lock
+import os
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+
+class TimedQueuePool(QueuePool):
+    # QueuePool that also records how long callers wait for a connection,
+    # so the pool can be sized against the number of gunicorn workers
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._stats_lock = Lock()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkouts += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+def pool_stats(pool):
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool._max_overflow
+        })
+    if isinstance(pool, TimedQueuePool):
+        with pool._stats_lock:
+            stats.update({
+                "checkouts": pool.checkouts,
+                "timeouts": pool.timeouts,
+                "wait_seconds_total": pool.wait_seconds_total,
+                "wait_seconds_max": pool.wait_seconds_max
+            })
+    return stats
+
+
+def _env_flag(name, default):
+    return os.environ.get(name, default).lower() in ("1", "true")
+
+
+def engine_options(database_uri):
+    # SQLALCHEMY_ENGINE_OPTIONS built from the environment (and so from
+    # .env through load_dotenv). SQLite keeps Flask-SQLAlchemy's defaults,
+    # since its pools don't take these settings.
+    if not database_uri or database_uri.startswith("sqlite"):
+        return {}
+
+    options = {
+        "poolclass": TimedQueuePool,
+        "pool_size": int(os.environ.get("SQLALCHEMY_POOL_SIZE", 5)),
+        "max_overflow": int(os.environ.get("SQLALCHEMY_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.environ.get("SQLALCHEMY_POOL_TIMEOUT", 30)),
+        # recycle connections before server or proxy idle timeouts drop them
+        "pool_recycle": int(os.environ.get("SQLALCHEMY_POOL_RECYCLE", 1800)),
+        "pool_pre_ping": _env_flag("SQLALCHEMY_POOL_PRE_PING", "true"),
+    }
+
+    # milliseconds; applied per connection by PostgreSQL
+    statement_timeout = os.environ.get("SQLALCHEMY_STATEMENT_TIMEOUT")
+    if statement_timeout and database_uri.startswith("postgres"):
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={int(statement_timeout)}"}
+
+    return options
@@ -0,0 +1,106 @@
+from itertools import cycle
+from threading import Lock
+import time
+
+from flask import g, has_request_context, request
+from flask_sqlalchemy import SQLAlchemy, SignallingSession
+from sqlalchemy import orm
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.dml import UpdateBase
+
+
+# Read-replica routing. Blueprints opt in with use_replica_for_reads; within
+# such a GET request plain SELECTs go to a replica until the session writes
+# anything, after which everything (including read-after-write) stays on the
+# primary. Outside opted-in requests, e.g. CLI commands, nothing changes.
+#
+# The replica is chosen once, at the first SELECT, and every later SELECT
+# in the request reuses it: reads that are compared with each other (the
+# change counter and the rows it versions) must see the same database.
+class RoutingSession(SignallingSession):
+    def get_bind(self, mapper=None, clause=None):
+        if has_request_context() and g.get("read_from_replica"):
+            if self._flushing or isinstance(clause, UpdateBase):
+                # writes, and every read after them, stay on the primary
+                g.read_from_replica = False
+            elif isinstance(clause, Select):
+                if "replica" not in g:
+                    g.replica = self.app.extensions["replicas"].choose()
+                if g.replica is not None:
+                    return g.replica
+        return super().get_bind(mapper, clause)
+
+
+class RoutingSQLAlchemy(SQLAlchemy):
+    def create_session(self, options):
+        return orm.sessionmaker(class_=RoutingSession, db=self, **options)
+
+
+def served_from_replica():
+    # whether this request's reads came from a replica; such results may
+    # be up to max_lag seconds old and shouldn't be cached as current
+    return has_request_context() and g.get("replica") is not None
+
+
+def use_replica_for_reads(blueprint):
+    @blueprint.before_request
+    def read_from_replica():
+        # HEAD is answered by the GET view as well
+        g.read_from_replica = request.method in ("GET", "HEAD")
+        # g outlives the request when an app context was already pushed
+        g.pop("replica", None)
+
+
+class ReplicaSet:
+    # Round-robins reads over the configured replicas, skipping any that are
+    # further behind the primary than max_lag seconds (None disables the
+    # check). Lag is measured at most once per check_interval per replica.
+    # With no usable replica, reads fall back to the primary.
+    def __init__(self, db, app, bind_keys, max_lag, check_interval):
+        self.db = db
+        self.app = app
+        self.bind_keys = bind_keys
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._order = cycle(bind_keys)
+        self._lag = {}
+        self._lock = Lock()
+
+    def engines(self):
+        return [self.db.get_engine(self.app, bind=key) for key in self.bind_keys]
+
+    def choose(self):
+        for _ in self.bind_keys:
+            with self._lock:
+                key = next(self._order)
+            engine = self.db.get_engine(self.app, bind=key)
+            if self.max_lag is None or self.lag(key, engine) <= self.max_lag:
+                return engine
+        return None
+
+    def lag(self, key, engine):
+        now = time.monotonic()
+        with self._lock:
+            cached = self._lag.get(key)
+        if cached and now - cached[1] < self.check_interval:
+            return cached[0]
+
+        try:
+            lag = measure_lag(engine)
+        except Exception:
+            # an unreachable replica is treated as infinitely stale
+            lag = float("inf")
+        with self._lock:
+            self._lag[key] = (lag, now)
+        return lag
+
+
+def measure_lag(engine):
+    if engine.dialect.name != "postgresql":
+        return 0.0
+    # zero when the replica has replayed everything it has received
+    lag = engine.execute(
+        "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+        "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+    ).scalar()
+    return float(lag or 0.0)
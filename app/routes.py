@@ -1,17 +1,45 @@
 from operator import ne
-from flask import Blueprint, jsonify, request, make_response, abort
+from flask import Blueprint, jsonify, request, make_response, abort, Response, stream_with_context, current_app
+from flask import json as flask_json
 from psycopg2 import Date
+from sqlalchemy import and_, select, tuple_
+from sqlalchemy.dialects import postgresql
 
 from app import db
 from app.models.task import Task
-from datetime import datetime
+from app.models.change_counter import ChangeCounter
+from app.models.deleted_task import DeletedTask
+from app.goal_progress import refresh_goal_counters
+from app.notifications import completion_message
+from app.outbox import outbox_enabled, record_completions
+from app.replicas import served_from_replica, use_replica_for_reads
+from app.search import search_tasks
+from datetime import datetime, timezone
+import base64
+import hashlib
+import json
 
 tasks_bp = Blueprint("tasks", __name__, url_prefix="/tasks")
+use_replica_for_reads(tasks_bp)
+
+# largest page a client can ask for with ?limit=
+MAX_PAGE_SIZE = 1000
+# most tasks accepted or changed by a single bulk request
+MAX_BULK_SIZE = 1000
+# rows fetched per round trip when streaming the full task list
+STREAM_BATCH_SIZE = 1000
+NDJSON_MIMETYPE = "application/x-ndjson"
+# page size for GET /tasks/search when no ?limit= is given
+SEARCH_PAGE_SIZE = 20
+
+# list endpoints select only these columns and serialize the plain rows,
+# skipping ORM instance construction and identity map bookkeeping
+TASK_LIST_COLUMNS = (Task.task_id, Task.title, Task.description, Task.completed_at, Task.goal_id)
 
 # helper functions to organize the code
 def task_dictionary(task):
     if task.completed_at is not None:
-        return {
+        response = {
             "task":{
                 "id": task.task_id,
                 "title": task.title,
@@ -20,7 +48,7 @@ def task_dictionary(task):
             }
         }
     else:
-        return {
+        response = {
             "task":{
                 "id": task.task_id,
                 "title": task.title,
@@ -29,11 +57,103 @@ def task_dictionary(task):
             }
         }
 
-def validate_task(task_id):
+    if task.goal_id is not None:
+        response["task"]["goal_id"] = task.goal_id
+    return response
+
+def task_etag(task):
+    return f"task-{task.task_id}-{task.version}"
+
+def task_list_version():
+    version = db.session.query(ChangeCounter.value).filter(
+        ChangeCounter.name == "task").scalar()
+    return version or 0
+
+def bump_task_list_version():
+    # called inside the writing transaction, so the counter and the rows
+    # it describes always commit together. Writers bump before touching
+    # any task: the counter row lock then orders writers by commit, and
+    # the rows they change can be stamped with stamped_list_version()
+    table = ChangeCounter.__table__
+    result = db.session.execute(
+        table.update().where(table.c.name == "task").values(value=table.c.value + 1))
+    if result.rowcount == 0:
+        db.session.execute(table.insert().values(name="task", value=1))
+
+def stamped_list_version():
+    # the counter value this transaction bumped to, as a SQL expression
+    # so stamping rows costs no extra round trip
+    return select([ChangeCounter.value]).where(ChangeCounter.name == "task").as_scalar()
+
+def next_list_version():
+    # the version to stamp a single-statement write with. On PostgreSQL the
+    # bump is folded into that statement as a data-modifying CTE, so it
+    # costs no extra statement and the counter row is only locked from the
+    # write to the commit; elsewhere the counter is bumped right away.
+    # Use the result in exactly one statement.
+    if not supports_returning():
+        bump_task_list_version()
+        return stamped_list_version()
+
+    table = ChangeCounter.__table__
+    bump = postgresql.insert(table).values(name="task", value=1).on_conflict_do_update(
+        index_elements=[table.c.name], set_={"value": table.c.value + 1}
+    ).returning(table.c.value).cte("bumped_list_version")
+    return select([bump.c.value]).as_scalar()
+
+def tombstones(condition, list_version):
+    table = Task.__table__
+    deleted = select([table.c.task_id, list_version])
+    if condition is not None:
+        deleted = deleted.where(condition)
+    return DeletedTask.__table__.insert().from_select(["task_id", "list_version"], deleted)
+
+def record_deletions(condition):
+    # tombstones for the tasks about to be deleted; must run before the DELETE
+    db.session.execute(tombstones(condition, next_list_version()))
+
+def delete_tasks_statement(condition):
+    # PostgreSQL: bumps the counter, records the tombstones and deletes
+    # the tasks in one statement; add RETURNING for the deleted rows
+    recorded = tombstones(condition, next_list_version()).returning(
+        DeletedTask.task_id).cte("tombstones")
+    table = Task.__table__
+    return table.delete().where(table.c.task_id.in_(select([recorded.c.task_id])))
+
+def task_list_etag():
+    # the same counter serves every listing, so the query string and the
+    # negotiated format are folded in to keep representations distinct
+    variant = request.query_string + str(request.accept_mimetypes.best).encode()
+    digest = hashlib.sha1(variant).hexdigest()[:16]
+    return f"tasks-{task_list_version()}-{digest}"
+
+def not_modified(etag):
+    response = make_response("", 304)
+    response.set_etag(etag)
+    return response
+
+def task_cache():
+    return current_app.extensions["task_cache"]
+
+def notifier():
+    return current_app.extensions["notifier"]
+
+def notify_completions(tasks):
+    # with the outbox enabled the relay delivers instead; otherwise the
+    # messages are queued for the notifier's workers and nobody waits on Slack
+    if outbox_enabled():
+        return
+    for task in tasks:
+        notifier().notify(completion_message(task.title))
+
+def validate_task_id(task_id):
     try:
-        task_id = int(task_id)
+        return int(task_id)
     except:
         abort(make_response({"details": f"Invalid task id '{task_id}'. Task id expected to be a number."}, 400))
+
+def validate_task(task_id):
+    task_id = validate_task_id(task_id)
     
     task = Task.query.get(task_id)
 
@@ -42,6 +162,388 @@ def validate_task(task_id):
     
     return task
 
+# updates (or deletes, when values is None) one task in a single
+# statement and returns the affected row, so mutating routes don't need
+# to load the task first. A missing task is reported from the empty result.
+# before_commit is called with the affected rows inside the transaction.
+def write_task(task_id, values=None, before_commit=None):
+    task_id = validate_task_id(task_id)
+
+    table = Task.__table__
+    condition = table.c.task_id == task_id
+    if values is not None:
+        values = dict(values, list_version=next_list_version())
+
+    if supports_returning():
+        if values is None:
+            statement = delete_tasks_statement(condition)
+        else:
+            statement = table.update().where(condition).values(
+                version=table.c.version + 1, **values)
+        statement = statement.returning(
+            table.c.task_id, table.c.title, table.c.description,
+            table.c.completed_at, table.c.goal_id)
+        task = db.session.execute(statement).first()
+    elif values is None:
+        # the deleted task's title is part of the response, so read it first
+        task = task_rows().filter(condition).first()
+        if task:
+            record_deletions(condition)
+            db.session.execute(table.delete().where(condition))
+    else:
+        statement = table.update().where(condition).values(version=table.c.version + 1, **values)
+        result = db.session.execute(statement)
+        task = task_rows().filter(condition).first() if result.rowcount else None
+
+    if task is None:
+        db.session.rollback()
+        abort(make_response({"details": f"No task with id '{task_id}' found."}, 404))
+
+    if values is None or "completed_at" in values:
+        refresh_goal_counters([task.goal_id])
+    if before_commit:
+        before_commit([task])
+    db.session.commit()
+    task_cache().invalidate(task_id)
+    return task
+
+def supports_returning():
+    return db.engine.dialect.name == "postgresql"
+
+def task_rows():
+    return db.session.query(*TASK_LIST_COLUMNS)
+
+def validate_limit(limit):
+    try:
+        limit = int(limit)
+    except:
+        abort(make_response({"details": f"Invalid limit '{limit}'. Limit expected to be a number."}, 400))
+
+    if limit < 1 or limit > MAX_PAGE_SIZE:
+        abort(make_response({"details": f"Invalid limit '{limit}'. Limit must be between 1 and {MAX_PAGE_SIZE}."}, 400))
+
+    return limit
+
+def validate_text(name, value):
+    # filters can come from a JSON body as well as the query string
+    if not isinstance(value, str):
+        abort(make_response({"details": f"Invalid {name} '{value}'. Expected a string."}, 400))
+    return value
+
+def validate_datetime(name, value):
+    validate_text(name, value)
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        abort(make_response({"details": f"Invalid {name} '{value}'. Expected an ISO 8601 date or datetime."}, 400))
+
+    # completed_at is stored as naive UTC
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def validate_since(since):
+    try:
+        since = int(since)
+    except:
+        abort(make_response({"details": f"Invalid since '{since}'. Expected a version from a previous response."}, 400))
+
+    if since < 0:
+        abort(make_response({"details": f"Invalid since '{since}'. Expected a version from a previous response."}, 400))
+
+    return since
+
+def next_prefix(prefix):
+    # the smallest string greater than every string starting with prefix,
+    # or None when there is none
+    prefix = prefix.rstrip(chr(0x10FFFF))
+    if not prefix:
+        return None
+    code_point = ord(prefix[-1]) + 1
+    if 0xD800 <= code_point <= 0xDFFF:
+        # surrogates can't be stored
+        code_point = 0xE000
+    return prefix[:-1] + chr(code_point)
+
+def title_prefix_filter(prefix):
+    if db.engine.dialect.name == "postgresql":
+        # served by ix_task_title_pattern
+        return Task.title.startswith(prefix, autoescape=True)
+
+    # SQLite's LIKE ignores ASCII case and can't use an index. It compares
+    # text bytewise, and UTF-8 keeps code point order, so the titles
+    # starting with prefix are exactly a range ix_task_title_task_id serves
+    condition = Task.title >= prefix
+    upper = next_prefix(prefix)
+    if upper is not None:
+        condition = and_(condition, Task.title < upper)
+    return condition
+
+# query parameters GET /tasks filters on, also accepted as a bulk filter
+TASK_FILTERS = ("is_complete", "title_prefix", "completed_after", "completed_before")
+
+def filter_tasks(query, params):
+    if "is_complete" in params:
+        is_complete = str(params["is_complete"]).lower()
+        if is_complete == "true":
+            query = query.filter(Task.completed_at.isnot(None))
+        elif is_complete == "false":
+            query = query.filter(Task.completed_at.is_(None))
+        else:
+            abort(make_response({"details": f"Invalid is_complete '{params['is_complete']}'. Expected true or false."}, 400))
+
+    if "title_prefix" in params:
+        title_prefix = validate_text("title_prefix", params["title_prefix"])
+        query = query.filter(title_prefix_filter(title_prefix))
+
+    # completed_after is inclusive and completed_before exclusive, so
+    # adjacent ranges never return the same task twice
+    if "completed_after" in params:
+        completed_after = validate_datetime("completed_after", params["completed_after"])
+        query = query.filter(Task.completed_at >= completed_after)
+
+    if "completed_before" in params:
+        completed_before = validate_datetime("completed_before", params["completed_before"])
+        query = query.filter(Task.completed_at < completed_before)
+
+    return query
+
+def validate_task_ids(task_ids):
+    if not isinstance(task_ids, list) or not task_ids:
+        abort(make_response({"details": "task_ids must be a non-empty list of task ids"}, 400))
+
+    if len(task_ids) > MAX_BULK_SIZE:
+        abort(make_response({"details": f"Too many task ids. At most {MAX_BULK_SIZE} tasks can be changed per request"}, 400))
+
+    for task_id in task_ids:
+        if not isinstance(task_id, int) or isinstance(task_id, bool):
+            abort(make_response({"details": f"Invalid task id '{task_id}'. Task id expected to be a number."}, 400))
+
+    return task_ids
+
+def bulk_task_query(request_body):
+    # bulk routes target either an explicit id list or the same filters
+    # GET /tasks accepts; an empty filter matches every task, up to
+    # MAX_BULK_SIZE of them
+    if not isinstance(request_body, dict):
+        abort(make_response({"details": "Request body must include task_ids or filter"}, 400))
+
+    if "task_ids" in request_body:
+        task_ids = validate_task_ids(request_body["task_ids"])
+        return Task.query.filter(Task.task_id.in_(task_ids)), task_ids
+
+    if isinstance(request_body.get("filter"), dict):
+        for key in request_body["filter"]:
+            if key not in TASK_FILTERS:
+                abort(make_response({"details": f"Unknown filter '{key}'. Expected one of {', '.join(TASK_FILTERS)}."}, 400))
+        query = filter_tasks(Task.query, request_body["filter"])
+
+        # resolve the filter to ids first, so a request never changes,
+        # invalidates or notifies for more tasks than an id list may name
+        matched_ids = [task_id for task_id, in query.with_entities(Task.task_id).limit(MAX_BULK_SIZE + 1)]
+        if len(matched_ids) > MAX_BULK_SIZE:
+            abort(make_response({"details": f"Filter matches more than {MAX_BULK_SIZE} tasks. Narrow the filter or send task_ids in batches of at most {MAX_BULK_SIZE}."}, 400))
+        return query.filter(Task.task_id.in_(matched_ids)), None
+
+    abort(make_response({"details": "Request body must include task_ids or filter"}, 400))
+
+# runs one UPDATE (or DELETE when values is None) over the selected tasks
+# and reports which of the requested ids matched. before_commit and
+# after_commit are called with the affected rows.
+def apply_bulk(request_body, values=None, before_commit=None, after_commit=None):
+    query, task_ids = bulk_task_query(request_body)
+
+    table = Task.__table__
+    if values is None and supports_returning():
+        statement = delete_tasks_statement(query.whereclause)
+    else:
+        if values is None:
+            record_deletions(query.whereclause)
+            statement = table.delete()
+        else:
+            statement = table.update().values(version=table.c.version + 1,
+                                              list_version=next_list_version(), **values)
+        if query.whereclause is not None:
+            statement = statement.where(query.whereclause)
+
+    if supports_returning():
+        matched = db.session.execute(statement.returning(
+            table.c.task_id, table.c.title, table.c.goal_id)).fetchall()
+    else:
+        matched = query.with_entities(Task.task_id, Task.title, Task.goal_id).all()
+        db.session.execute(statement)
+    matched_ids = sorted(row.task_id for row in matched)
+    if matched_ids:
+        refresh_goal_counters(row.goal_id for row in matched)
+        if before_commit:
+            before_commit(matched)
+        db.session.commit()
+    else:
+        # nothing changed, so don't move the counter either
+        db.session.rollback()
+    task_cache().invalidate(*matched_ids)
+    if after_commit:
+        after_commit(matched)
+
+    response = {"matched_ids": matched_ids}
+    if task_ids is not None:
+        found = set(matched_ids)
+        response["missing_ids"] = [task_id for task_id in task_ids if task_id not in found]
+    return response
+
+def sort_key(params):
+    # mirrors the old behaviour: any sort value other than "desc" sorts ascending
+    if "sort" not in params:
+        return "id"
+    if params["sort"] == "desc":
+        return "desc"
+    return "asc"
+
+# a missing title sorts as greater than every title, on every database.
+# That is the order PostgreSQL stores a btree index on (title, task_id)
+# in; SQLite stores NULLs first, which is why pages fetch titled and
+# untitled tasks separately (see page_queries)
+def order_tasks(query, sort):
+    if sort == "desc":
+        return query.order_by(Task.title.desc().nullsfirst(), Task.task_id.desc())
+    elif sort == "asc":
+        return query.order_by(Task.title.nullslast(), Task.task_id)
+    return query.order_by(Task.task_id)
+
+# cursors are opaque to clients: base64 of the sort mode plus the keyset
+# values of the last task on the previous page
+def encode_cursor(sort, task):
+    if sort == "id":
+        key = [task.task_id]
+    else:
+        key = [task.title, task.task_id]
+    payload = json.dumps({"sort": sort, "key": key})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_cursor(cursor, sort):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        key = payload["key"]
+        cursor_sort = payload["sort"]
+    except:
+        abort(make_response({"details": f"Invalid cursor '{cursor}'."}, 400))
+
+    if cursor_sort != sort or not valid_cursor_key(key, sort):
+        abort(make_response({"details": f"Cursor '{cursor}' does not match the requested sort."}, 400))
+
+    return key
+
+def valid_cursor_key(key, sort):
+    if not isinstance(key, list) or len(key) != (1 if sort == "id" else 2):
+        return False
+    task_id = key[-1]
+    if not isinstance(task_id, int) or isinstance(task_id, bool):
+        return False
+    return sort == "id" or key[0] is None or isinstance(key[0], str)
+
+def page_queries(query, sort, key):
+    # keyset pagination: filter on the ordering columns so the database
+    # can seek straight to the next page through the index. A row value
+    # comparison with a NULL title is NULL, and an OR that also matches
+    # untitled tasks would stop the seek, so titled and untitled tasks are
+    # fetched by separate queries, in the order their pages come in
+    if sort == "id":
+        return [query if key is None else query.filter(Task.task_id > key[-1])]
+
+    titled = query.filter(Task.title.isnot(None))
+    untitled = query.filter(Task.title.is_(None))
+    if key is None:
+        return [titled, untitled] if sort == "asc" else [untitled, titled]
+
+    title, task_id = key
+    if sort == "asc":
+        if title is None:
+            return [untitled.filter(Task.task_id > task_id)]
+        return [titled.filter(tuple_(Task.title, Task.task_id) > tuple_(title, task_id)), untitled]
+    if title is None:
+        return [untitled.filter(Task.task_id < task_id), titled]
+    return [titled.filter(tuple_(Task.title, Task.task_id) < tuple_(title, task_id))]
+
+def paginate_tasks(query, params):
+    limit = validate_limit(params["limit"])
+    sort = sort_key(params)
+    key = decode_cursor(params["cursor"], sort) if "cursor" in params else None
+
+    # fetch one extra row to find out whether there is a next page; a
+    # later query only runs to top up a page the earlier one left short
+    tasks = []
+    for page_query in page_queries(query, sort, key):
+        tasks += order_tasks(page_query, sort).limit(limit + 1 - len(tasks)).all()
+        if len(tasks) > limit:
+            break
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(sort, tasks[-1])
+
+    return tasks, next_cursor
+
+# search results are ordered by a rank recomputed on every query, so
+# pages are addressed by offset rather than by a keyset
+def encode_search_cursor(offset):
+    payload = json.dumps({"sort": "rank", "key": [offset]})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def decode_search_cursor(cursor):
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        offset = payload["key"][0]
+        cursor_sort = payload["sort"]
+    except:
+        abort(make_response({"details": f"Invalid cursor '{cursor}'."}, 400))
+
+    if cursor_sort != "rank" or not isinstance(offset, int) or offset < 0:
+        abort(make_response({"details": f"Cursor '{cursor}' does not match the requested sort."}, 400))
+
+    return offset
+
+def task_list_item(task):
+    return {
+        "id": task.task_id,
+        "title": task.title,
+        "description": task.description,
+        "is_complete": task.completed_at is not None
+    }
+
+def wants_stream(params):
+    if params.get("stream") in ("1", "true"):
+        return True
+    return request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+def stream_tasks(query):
+    ndjson = request.accept_mimetypes.best == NDJSON_MIMETYPE
+
+    # yield_per makes SQLAlchemy use a server-side cursor where the driver
+    # supports one, so only one batch of tasks is held in memory at a time
+    def generate():
+        try:
+            if not ndjson:
+                yield "["
+            for index, task in enumerate(query.yield_per(STREAM_BATCH_SIZE)):
+                # the app's JSON encoder, as for jsonify
+                item = flask_json.dumps(task_list_item(task))
+                if ndjson:
+                    yield item + "\n"
+                elif index == 0:
+                    yield item
+                else:
+                    yield "," + item
+            if not ndjson:
+                yield "]"
+        finally:
+            # the cursor keeps a transaction open; end it as soon as the
+            # stream is done or the client goes away
+            query.session.close()
+
+    mimetype = NDJSON_MIMETYPE if ndjson else "application/json"
+    return Response(stream_with_context(generate()), mimetype=mimetype)
+
 # code to execute routes
 @tasks_bp.route("", methods=["POST"])
 def create_task():
@@ -50,85 +552,213 @@ def create_task():
     if "title" not in request_body or "description" not in request_body:
         return jsonify({"details": f"Invalid data"}), 400
 
-    if "completed_at" in request_body:
-        new_task = Task(
-            title=request_body["title"],
-            description=request_body["description"],
-            completed_at = datetime.utcnow()
-        )
+    values = {
+        "title": request_body["title"],
+        "description": request_body["description"],
+        "completed_at": datetime.utcnow() if "completed_at" in request_body else None
+    }
+    if supports_returning():
+        # SQLAlchemy 1.3 skips Python-side column defaults on an INSERT
+        # that carries a DML CTE, so version is set explicitly
+        statement = Task.__table__.insert().values(
+            version=1, list_version=next_list_version(), **values
+        ).returning(*TASK_LIST_COLUMNS)
+        new_task = db.session.execute(statement).first()
     else:
-        new_task = Task(
-            title=request_body["title"],
-            description=request_body["description"]
-        )
-    db.session.add(new_task)
+        new_task = Task(list_version=next_list_version(), **values)
+        db.session.add(new_task)
     db.session.commit()
 
     return task_dictionary(new_task), 201
 
+@tasks_bp.route("/bulk", methods=["POST"])
+def create_tasks_bulk():
+    request_body = request.get_json()
+
+    if not isinstance(request_body, list) or not request_body:
+        return jsonify({"details": "Request body must be a non-empty list of tasks"}), 400
+
+    if len(request_body) > MAX_BULK_SIZE:
+        return jsonify({"details": f"Too many tasks. At most {MAX_BULK_SIZE} tasks can be created per request"}), 400
+
+    # validate everything before touching the database so a bad entry
+    # never leaves a partially imported batch behind
+    rows = []
+    for index, task_body in enumerate(request_body):
+        if not isinstance(task_body, dict) or "title" not in task_body or "description" not in task_body:
+            return jsonify({"details": f"Invalid data for task at index {index}"}), 400
+
+        rows.append({
+            "title": task_body["title"],
+            "description": task_body["description"],
+            "completed_at": datetime.utcnow() if "completed_at" in task_body else None
+        })
+
+    if supports_returning():
+        # one multi-row INSERT ... RETURNING round trip, counter bump included
+        # version is explicit for the same reason as in create_task
+        list_version = next_list_version()
+        for row in rows:
+            row.update(version=1, list_version=list_version)
+        statement = Task.__table__.insert().values(rows).returning(Task.task_id)
+        task_ids = [row.task_id for row in db.session.execute(statement)]
+    else:
+        # bulk_insert_mappings can't take SQL expressions, so read the value
+        bump_task_list_version()
+        list_version = task_list_version()
+        for row in rows:
+            row["list_version"] = list_version
+        db.session.bulk_insert_mappings(Task, rows, return_defaults=True)
+        task_ids = [row["task_id"] for row in rows]
+    db.session.commit()
+
+    return jsonify({"task_ids": task_ids}), 201
+
 @tasks_bp.route("", methods=["GET"])
 def get_all_tasks():
     params = request.args
 
-    if "sort" in params:
-        if params["sort"] == "desc":
-            tasks = Task.query.order_by(Task.title.desc()).all()
-        else:
-            tasks = Task.query.order_by(Task.title).all()
+    # read the counter before the rows: the body is then never older than
+    # the ETag it is sent with, so a later 304 can't hide a change
+    etag = task_list_etag()
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    query = filter_tasks(task_rows(), params)
+
+    if wants_stream(params):
+        response = stream_tasks(order_tasks(query, sort_key(params)))
+    elif "limit" in params:
+        tasks, next_cursor = paginate_tasks(query, params)
+        response = jsonify({
+            "tasks": [task_list_item(task) for task in tasks],
+            "next_cursor": next_cursor
+        })
     else:
-        tasks = Task.query.all()
+        tasks = order_tasks(query, sort_key(params)).all()
+        response = jsonify([task_list_item(task) for task in tasks])
 
-    response = []
-    for task in tasks:
-        response.append(
-            {
-            "id": task.task_id,
-            "title": task.title,
-            "description": task.description,
-            "is_complete": False 
-            }
-        )
-    return jsonify(response), 200
+    response.set_etag(etag)
+    return response, 200
+
+@tasks_bp.route("/changes", methods=["GET"])
+def get_task_changes():
+    # read the counter before the rows, as for the ETag: every change up
+    # to version is included, and a later one that sneaks in is simply
+    # sent again next time
+    version = task_list_version()
+    query = task_rows()
+
+    # without since, or with one from a database that has since been
+    # reset, the response is the full list and replaces the client's copy
+    since = validate_since(request.args["since"]) if "since" in request.args else None
+    full = since is None or since > version
+    deleted_ids = []
+    if not full:
+        query = query.filter(Task.list_version > since)
+        # an id can be deleted and reused (SQLite); clients drop
+        # deleted_ids before applying tasks
+        deleted_ids = sorted({task_id for task_id, in db.session.query(
+            DeletedTask.task_id).filter(DeletedTask.list_version > since)})
+
+    tasks = query.order_by(Task.task_id).all()
+    return jsonify({
+        "version": version,
+        "full": full,
+        "tasks": [task_list_item(task) for task in tasks],
+        "deleted_ids": deleted_ids
+    }), 200
+
+@tasks_bp.route("/search", methods=["GET"])
+def search_all_tasks():
+    params = request.args
+    terms = params.get("q", "").strip()
+    if not terms:
+        return jsonify({"details": "Search requires a non-empty q parameter"}), 400
+
+    limit = validate_limit(params.get("limit", SEARCH_PAGE_SIZE))
+    offset = decode_search_cursor(params["cursor"]) if "cursor" in params else 0
+
+    tasks, has_more = search_tasks(terms, TASK_LIST_COLUMNS, limit, offset)
+    return jsonify({
+        "tasks": [task_list_item(task) for task in tasks],
+        "next_cursor": encode_search_cursor(offset + limit) if has_more else None
+    }), 200
 
 @tasks_bp.route("/<task_id>", methods=["GET"])
 def get_one_task(task_id):
-    task = validate_task(task_id)
-    return task_dictionary(task), 200
+    cache = task_cache()
+    cached = cache.get(validate_task_id(task_id)) if cache.enabled else None
+
+    if cached is None and request.if_none_match:
+        # only the version is needed to answer a matching conditional GET
+        task = db.session.query(Task.task_id, Task.version).filter(
+            Task.task_id == validate_task_id(task_id)).first()
+        if task and request.if_none_match.contains(task_etag(task)):
+            return not_modified(task_etag(task))
+
+    if cached is None:
+        task = validate_task(task_id)
+        cached = (task_dictionary(task), task_etag(task))
+        # a replica may still hold the version a write just invalidated;
+        # caching it would keep it around for another TASK_CACHE_TTL
+        if not served_from_replica():
+            cache.set(task.task_id, cached)
+
+    task_response, etag = cached
+    if request.if_none_match.contains(etag):
+        return not_modified(etag)
+
+    response = make_response(task_response, 200)
+    response.set_etag(etag)
+    return response
 
 @tasks_bp.route("/<task_id>", methods=["PUT"])
 def update_one_task(task_id):
-    task = validate_task(task_id)
+    validate_task_id(task_id)
     request_body = request.get_json()
     if "title" not in request_body or "description" not in request_body:
         return jsonify({"details": f"Request to update must include title and description"}), 400
     
-    task.title = request_body["title"]
-    task.description = request_body["description"]
-
-    db.session.commit()
+    task = write_task(task_id, {
+        "title": request_body["title"],
+        "description": request_body["description"]
+    })
 
     return task_dictionary(task), 200
 
 @tasks_bp.route("/<task_id>", methods=["DELETE"])
 def delete_task(task_id):
-    task = validate_task(task_id)
-
-    db.session.delete(task)
-    db.session.commit()
+    task = write_task(task_id)
 
     return make_response(jsonify({'details': f'Task {task_id} "{task.title}" successfully deleted'}), 200)
 
 @tasks_bp.route("/<task_id>/mark_complete", methods=["PATCH"])
 def mark_complete_task(task_id):
-    task = validate_task(task_id)
-    task.completed_at = datetime.utcnow()
-    db.session.commit()
+    task = write_task(task_id, {"completed_at": datetime.utcnow()},
+                      before_commit=record_completions)
+    notify_completions([task])
 
     return task_dictionary(task), 200
 
 @tasks_bp.route("/<task_id>/mark_incomplete", methods=["PATCH"])
 def mark_incomplete_task(task_id):
-    task = validate_task(task_id)
-    task.completed_at = None
-    db.session.commit()
+    task = write_task(task_id, {"completed_at": None})
     return task_dictionary(task), 200
+
+@tasks_bp.route("/bulk/mark_complete", methods=["PATCH"])
+def mark_complete_tasks_bulk():
+    response = apply_bulk(request.get_json(), {"completed_at": datetime.utcnow()},
+                          before_commit=record_completions,
+                          after_commit=notify_completions)
+    return jsonify(response), 200
+
+@tasks_bp.route("/bulk/mark_incomplete", methods=["PATCH"])
+def mark_incomplete_tasks_bulk():
+    response = apply_bulk(request.get_json(), {"completed_at": None})
+    return jsonify(response), 200
+
+@tasks_bp.route("/bulk", methods=["DELETE"])
+def delete_tasks_bulk():
+    response = apply_bulk(request.get_json())
+    return jsonify(response), 200
@@ -0,0 +1,92 @@
+from sqlalchemy import DDL, event, func, literal_column, text
+from sqlalchemy.sql import column, table
+
+from app import db
+from app.models.task import TITLE_PATTERN_INDEX, Task
+
+# Full-text search over task title and description. The index lives
+# outside the models because each database needs its own:
+#
+# - PostgreSQL: a tsvector column on task, kept current by a trigger so
+#   every write path (ORM, bulk and RETURNING statements) stays covered,
+#   with a GIN index.
+# - SQLite: an FTS5 table over task, kept current by triggers.
+#
+# Both are created with the task table (db.create_all) and by migration
+# 9c4d2e7f1a38 for existing databases.
+SEARCH_CONFIG = "english"
+
+POSTGRES_CREATE = [
+    "ALTER TABLE task ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "CREATE INDEX IF NOT EXISTS ix_task_search_vector ON task USING gin (search_vector)",
+    "DROP TRIGGER IF EXISTS task_search_vector_update ON task",
+    "CREATE TRIGGER task_search_vector_update BEFORE INSERT OR UPDATE OF title, description "
+    "ON task FOR EACH ROW EXECUTE PROCEDURE "
+    f"tsvector_update_trigger(search_vector, 'pg_catalog.{SEARCH_CONFIG}', title, description)",
+]
+
+SQLITE_CREATE = [
+    # a stale index from a dropped task table would match the wrong rows
+    "DROP TABLE IF EXISTS task_search",
+    "CREATE VIRTUAL TABLE task_search USING fts5("
+    "title, description, content='task', content_rowid='task_id')",
+    "INSERT INTO task_search (task_search) VALUES ('rebuild')",
+    "CREATE TRIGGER IF NOT EXISTS task_search_insert AFTER INSERT ON task BEGIN "
+    "INSERT INTO task_search (rowid, title, description) "
+    "VALUES (new.task_id, new.title, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS task_search_delete AFTER DELETE ON task BEGIN "
+    "INSERT INTO task_search (task_search, rowid, title, description) "
+    "VALUES ('delete', old.task_id, old.title, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS task_search_update AFTER UPDATE OF title, description ON task BEGIN "
+    "INSERT INTO task_search (task_search, rowid, title, description) "
+    "VALUES ('delete', old.task_id, old.title, old.description); "
+    "INSERT INTO task_search (rowid, title, description) "
+    "VALUES (new.task_id, new.title, new.description); END",
+]
+
+task_search = table("task_search", column("rowid"))
+
+# schema objects alembic autogenerate should leave alone
+SEARCH_OBJECTS = {"search_vector", "ix_task_search_vector", "task_search",
+                  "task_search_data", "task_search_idx", "task_search_content",
+                  "task_search_docsize", "task_search_config", TITLE_PATTERN_INDEX}
+
+for statement in POSTGRES_CREATE:
+    event.listen(Task.__table__, "after_create",
+                 DDL(statement).execute_if(dialect="postgresql"))
+for statement in SQLITE_CREATE:
+    event.listen(Task.__table__, "after_create",
+                 DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Task.__table__, "before_drop",
+             DDL("DROP TABLE IF EXISTS task_search").execute_if(dialect="sqlite"))
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    return not (reflected and compare_to is None and name in SEARCH_OBJECTS)
+
+def fts5_query(terms):
+    # quote every word so FTS5 operators in user input are matched as
+    # text; words are ANDed, like plainto_tsquery does
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms.split())
+
+def search_tasks(terms, columns, limit, offset):
+    # returns (rows, has_more) for one page of matches, best first;
+    # ties are broken by task_id so pages are stable
+    if db.engine.dialect.name == "postgresql":
+        query = func.plainto_tsquery(SEARCH_CONFIG, terms)
+        rank = func.ts_rank(literal_column("task.search_vector"), query)
+        statement = db.session.query(*columns).filter(
+            literal_column("task.search_vector").op("@@")(query)
+        ).order_by(rank.desc(), Task.task_id)
+    else:
+        match = fts5_query(terms)
+        if not match:
+            return [], False
+        # bm25() is lower for better matches
+        statement = db.session.query(*columns).join(
+            task_search, task_search.c.rowid == Task.task_id
+        ).filter(text("task_search MATCH :match")).params(match=match).order_by(
+            func.bm25(literal_column("task_search")), Task.task_id)
+
+    rows = statement.offset(offset).limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
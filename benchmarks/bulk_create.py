@@ -0,0 +1,46 @@
+"""Compare N calls to POST /tasks against POST /tasks/bulk.
+
+    python -m benchmarks.bulk_create --sizes 100,1000
+"""
+import argparse
+
+from app.routes import MAX_BULK_SIZE
+from benchmarks.common import best_of, make_app, parse_sizes, seed_tasks
+
+
+def task_bodies(count):
+    return [{"title": f"Imported {number}", "description": "bulk benchmark"}
+            for number in range(count)]
+
+
+def one_by_one(client, bodies):
+    for body in bodies:
+        client.post("/tasks", json=body)
+
+
+def bulk(client, bodies):
+    for start in range(0, len(bodies), MAX_BULK_SIZE):
+        client.post("/tasks/bulk", json=bodies[start:start + MAX_BULK_SIZE])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=parse_sizes, default=[100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = make_app()
+    client = app.test_client()
+    with app.app_context():
+        print(f"{'tasks':>8} {'POST /tasks (s)':>16} {'bulk (s)':>10} {'speedup':>8}")
+        for size in args.sizes:
+            bodies = task_bodies(size)
+            seed_tasks(0)
+            single = best_of(lambda: one_by_one(client, bodies), args.repeat)
+            seed_tasks(0)
+            batched = best_of(lambda: bulk(client, bodies), args.repeat)
+            print(f"{size:>8} {single:>16.3f} {batched:>10.3f} {single / batched:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
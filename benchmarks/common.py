@@ -0,0 +1,76 @@
+import os
+import tempfile
+import time
+from datetime import datetime
+
+from app import create_app, db
+from app.models.goal import Goal
+from app.models.task import Task
+
+# benchmarks drop and recreate tables, so they never touch the database
+# configured for the app; point BENCHMARK_DATABASE_URI at a scratch database
+DEFAULT_DATABASE_URI = "sqlite:///" + os.path.join(
+    tempfile.gettempdir(), "task_list_benchmark.db")
+
+SEED_BATCH_SIZE = 10000
+
+
+def benchmark_database_uri():
+    return os.environ.get("BENCHMARK_DATABASE_URI", DEFAULT_DATABASE_URI)
+
+
+def benchmark_environment():
+    # the scratch database and none of the configured app's side effects:
+    # no replicas, no Slack posts, no outbox rows
+    return {
+        "SQLALCHEMY_DATABASE_URI": benchmark_database_uri(),
+        "SQLALCHEMY_REPLICA_URIS": "",
+        "SLACK_BOT_TOKEN": "",
+        "OUTBOX_ENABLED": "false",
+    }
+
+
+def make_app(**config):
+    # set before create_app, which builds the engine options and the
+    # Slack notifier from the environment
+    os.environ.update(benchmark_environment())
+    app = create_app()
+    app.config.update(config)
+    return app
+
+
+def seed_tasks(count, completed_every=3, goals=0):
+    db.drop_all()
+    db.create_all()
+
+    if goals:
+        db.session.execute(Goal.__table__.insert(), [
+            {"title": f"Goal {number}"} for number in range(goals)])
+
+    insert = Task.__table__.insert()
+    now = datetime.utcnow()
+    for start in range(0, count, SEED_BATCH_SIZE):
+        batch = []
+        for number in range(start, min(start + SEED_BATCH_SIZE, count)):
+            batch.append({
+                "title": f"Task {number:08d}",
+                "description": f"Seeded task number {number}",
+                "completed_at": now if number % completed_every == 0 else None,
+                "goal_id": number % goals + 1 if goals else None
+            })
+        db.session.execute(insert, batch)
+    db.session.commit()
+
+
+def best_of(function, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+        db.session.remove()
+    return min(timings)
+
+
+def parse_sizes(value):
+    return [int(size) for size in value.split(",")]
@@ -0,0 +1,49 @@
+"""Compare the two ways of serving GET /goals?progress=true: a GROUP BY
+aggregate over task on every read, or counters kept on the goal row by
+every write. Reports read latency and the extra cost counters add to
+PATCH /tasks/<id>/mark_complete.
+
+    python -m benchmarks.goal_progress --tasks 1000000 --goals 1000
+"""
+import argparse
+
+from app import db
+from app.goal_progress import recount_goals
+from app.models.goal import Goal
+from benchmarks.common import best_of, make_app, seed_tasks
+
+
+def run(counters, args):
+    app = make_app(GOAL_PROGRESS_COUNTERS=counters)
+    client = app.test_client()
+    with app.app_context():
+        seed_tasks(args.tasks, goals=args.goals)
+        recount_goals(goal_id for goal_id, in db.session.query(Goal.goal_id))
+        db.session.commit()
+
+        read = best_of(lambda: client.get("/goals?progress=true"), args.repeat)
+
+        def complete_tasks():
+            for task_id in range(1, args.writes + 1):
+                client.patch(f"/tasks/{task_id}/mark_complete")
+        write = best_of(complete_tasks, args.repeat) / args.writes
+
+    label = "counters" if counters else "aggregate"
+    print(f"{label:>10} {read * 1000:>16.2f} {write * 1000:>22.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--goals", type=int, default=1000)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'mode':>10} {'GET /goals (ms)':>16} {'mark_complete (ms)':>22}")
+    run(False, args)
+    run(True, args)
+
+
+if __name__ == "__main__":
+    main()
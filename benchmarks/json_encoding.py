@@ -0,0 +1,48 @@
+"""Compare the orjson and stdlib JSON_BACKENDs on GET /tasks responses,
+both end to end and for encoding the list alone.
+
+    python -m benchmarks.json_encoding --sizes 1000,10000,100000
+"""
+import argparse
+import os
+
+from flask import jsonify
+
+from app.routes import task_list_item, task_rows
+from app.models.task import Task
+from benchmarks.common import best_of, make_app, parse_sizes, seed_tasks
+
+
+def run(backend, size, args):
+    # JSON_BACKEND is read when the app is created
+    os.environ["JSON_BACKEND"] = backend
+    app = make_app()
+
+    client = app.test_client()
+    with app.app_context():
+        tasks = [task_list_item(task) for task in task_rows().order_by(Task.task_id)]
+        with app.test_request_context():
+            encode = best_of(lambda: jsonify(tasks).get_data(), args.repeat)
+        request = best_of(lambda: client.get("/tasks").get_data(), args.repeat)
+        body = len(client.get("/tasks").get_data())
+
+    print(f"{size:>8} {backend:>8} {encode * 1000:>12.2f} {request * 1000:>14.2f} {body:>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=parse_sizes, default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'tasks':>8} {'backend':>8} {'encode (ms)':>12} {'GET /tasks (ms)':>14} {'bytes':>12}")
+    for size in args.sizes:
+        app = make_app()
+        with app.app_context():
+            seed_tasks(size)
+        for backend in ("stdlib", "orjson"):
+            run(backend, size, args)
+
+
+if __name__ == "__main__":
+    main()
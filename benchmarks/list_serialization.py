@@ -0,0 +1,41 @@
+"""Compare ORM hydration against column projection for GET /tasks.
+
+    python -m benchmarks.list_serialization --sizes 1000,100000,1000000
+"""
+import argparse
+import json
+
+from app.models.task import Task
+from app.routes import task_list_item, task_rows
+from benchmarks.common import best_of, make_app, parse_sizes, seed_tasks
+
+
+def orm_path():
+    tasks = Task.query.order_by(Task.task_id).all()
+    return json.dumps([task_list_item(task) for task in tasks])
+
+
+def projected_path():
+    tasks = task_rows().order_by(Task.task_id).all()
+    return json.dumps([task_list_item(task) for task in tasks])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=parse_sizes,
+                        default=[1000, 100000, 1000000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        print(f"{'rows':>10} {'orm (s)':>10} {'projected (s)':>14} {'speedup':>8}")
+        for size in args.sizes:
+            seed_tasks(size)
+            orm = best_of(orm_path, args.repeat)
+            projected = best_of(projected_path, args.repeat)
+            print(f"{size:>10} {orm:>10.3f} {projected:>14.3f} {orm / projected:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
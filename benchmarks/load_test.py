@@ -0,0 +1,319 @@
+"""Load test every route in app/routes.py over HTTP. Seeds the benchmark
+database, starts gunicorn against it (or targets --url), drives each route
+with concurrent clients and writes latency percentiles, throughput and
+per-worker memory to a JSON file that can be compared between commits.
+
+    python -m benchmarks.load_test --tasks 1000000 --workers 4 --concurrency 32
+    python -m benchmarks.load_test --url http://localhost:5000 --no-seed
+    python -m benchmarks.load_test --only mixed_writes --write-concurrency 64
+"""
+import argparse
+import json
+import os
+import random
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import requests
+
+from app.routes import MAX_BULK_SIZE
+from benchmarks.common import benchmark_environment, make_app, seed_tasks
+
+BULK_SIZE = 100
+READY_TIMEOUT = 30
+
+
+class Scenario:
+    # one route: build() returns (method, path, json body) for a request;
+    # read-only scenarios are run first so writes don't skew them.
+    # prepare(url), if given, runs untimed just before the scenario
+    def __init__(self, name, build, read_only=True, prepare=None):
+        self.name = name
+        self.build = build
+        self.read_only = read_only
+        self.prepare = prepare
+
+
+def new_task(number=0):
+    return {"title": f"Load test task {number}", "description": "Created by load_test"}
+
+
+def create_tasks(url, count):
+    # returns the ids of count new tasks, created through the API
+    task_ids = []
+    with requests.Session() as session:
+        while len(task_ids) < count:
+            batch = [new_task(number) for number in range(min(MAX_BULK_SIZE, count - len(task_ids)))]
+            response = session.post(url + "/tasks/bulk", json=batch)
+            response.raise_for_status()
+            task_ids.extend(response.json()["task_ids"])
+    return task_ids
+
+
+class IdPool:
+    # ids for the delete scenarios, created by the run itself so no id is
+    # deleted twice and the seeded tasks are left alone whatever --tasks is
+    def __init__(self, per_request, requests_count):
+        self.per_request = per_request
+        self.requests_count = requests_count
+        self.ids = []
+        self.lock = threading.Lock()
+
+    def fill(self, url):
+        self.ids = create_tasks(url, self.per_request * self.requests_count)
+
+    def take(self):
+        with self.lock:
+            taken = self.ids[-self.per_request:]
+            del self.ids[-self.per_request:]
+        return taken
+
+
+def scenarios(args):
+    task_ids = lambda: random.randint(1, args.tasks)
+    delete_ids = IdPool(1, args.requests)
+    bulk_delete_ids = IdPool(BULK_SIZE, args.requests)
+
+    # seeded tasks have list_version 0, so on a freshly seeded database the
+    # changes since 0 are just the few tasks written through the API
+    sync = {"version": 0}
+
+    def sync_version(url):
+        response = requests.get(url + "/tasks/changes", params={"since": 0})
+        response.raise_for_status()
+        sync["version"] = response.json()["version"]
+
+    found = [
+        Scenario("list_page", lambda: ("GET", "/tasks?limit=100", None)),
+        Scenario("list_filtered", lambda: (
+            "GET", "/tasks?is_complete=false&sort=asc&limit=100", None)),
+        Scenario("get_task", lambda: ("GET", f"/tasks/{task_ids()}", None)),
+        Scenario("task_changes", lambda: (
+            "GET", f"/tasks/changes?since={sync['version']}", None), prepare=sync_version),
+        # every seeded task matches "seeded"; a task number matches one task
+        Scenario("search_common", lambda: ("GET", "/tasks/search?q=seeded", None)),
+        Scenario("search_rare", lambda: ("GET", f"/tasks/search?q={task_ids() - 1}", None)),
+    ]
+    if args.tasks <= args.full_list_max:
+        found += [
+            Scenario("list_all", lambda: ("GET", "/tasks", None)),
+            Scenario("list_stream", lambda: ("GET", "/tasks?stream=true", None)),
+        ]
+    found += [
+        Scenario("create_task", lambda: ("POST", "/tasks", new_task()), False),
+        Scenario("create_tasks_bulk", lambda: (
+            "POST", "/tasks/bulk", [new_task(number) for number in range(BULK_SIZE)]), False),
+        Scenario("update_task", lambda: (
+            "PUT", f"/tasks/{task_ids()}", {"title": "Updated", "description": "Updated"}), False),
+        Scenario("mark_complete", lambda: ("PATCH", f"/tasks/{task_ids()}/mark_complete", None), False),
+        Scenario("mark_incomplete", lambda: ("PATCH", f"/tasks/{task_ids()}/mark_incomplete", None), False),
+        Scenario("bulk_mark_complete", lambda: ("PATCH", "/tasks/bulk/mark_complete", {
+            "task_ids": [task_ids() for _ in range(BULK_SIZE)]}), False),
+        Scenario("bulk_mark_incomplete", lambda: ("PATCH", "/tasks/bulk/mark_incomplete", {
+            "task_ids": [task_ids() for _ in range(BULK_SIZE)]}), False),
+        # every write bumps the one change counter row, so this measures
+        # how writers to different tasks contend on it
+        Scenario("mixed_writes", lambda: random.choice([
+            ("POST", "/tasks", new_task()),
+            ("PUT", f"/tasks/{task_ids()}", {"title": "Updated", "description": "Updated"}),
+            ("PATCH", f"/tasks/{task_ids()}/mark_complete", None),
+            ("PATCH", f"/tasks/{task_ids()}/mark_incomplete", None),
+        ]), False),
+        Scenario("delete_task", lambda: (
+            "DELETE", f"/tasks/{delete_ids.take()[0]}", None), False, delete_ids.fill),
+        Scenario("delete_tasks_bulk", lambda: ("DELETE", "/tasks/bulk", {
+            "task_ids": bulk_delete_ids.take()}), False, bulk_delete_ids.fill),
+    ]
+    if args.only:
+        found = [scenario for scenario in found if scenario.name in args.only]
+    return found
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run_scenario(scenario, url, args):
+    local = threading.local()
+
+    def session():
+        # one keep-alive connection per client thread
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        return local.session
+
+    def send(_):
+        method, path, body = scenario.build()
+        start = time.perf_counter()
+        try:
+            response = session().request(method, url + path, json=body, timeout=args.timeout)
+            response.content
+            ok = response.status_code < 400
+        except requests.RequestException:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    concurrency = args.concurrency
+    if not scenario.read_only and args.write_concurrency:
+        concurrency = args.write_concurrency
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(send, range(args.requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    errors = sum(1 for _, ok in results if not ok)
+    to_ms = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        "requests": len(results),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(results) / elapsed, 1),
+        "p50_ms": to_ms(percentile(latencies, 0.50)),
+        "p95_ms": to_ms(percentile(latencies, 0.95)),
+        "p99_ms": to_ms(percentile(latencies, 0.99)),
+        "max_ms": to_ms(latencies[-1] if latencies else None),
+    }
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args):
+    port = free_port()
+    command = [sys.executable, "-m", "gunicorn", "--workers", str(args.workers),
+               "--bind", f"127.0.0.1:{port}", "--log-level", "warning"]
+    if args.serve_mode == "gevent":
+        command += ["-c", "gunicorn_async.conf.py"]
+    command.append("app:create_app()")
+
+    environment = dict(os.environ, **benchmark_environment())
+    server = subprocess.Popen(command, env=environment)
+    url = f"http://127.0.0.1:{port}"
+
+    ready = False
+    try:
+        deadline = time.monotonic() + READY_TIMEOUT
+        while time.monotonic() < deadline:
+            try:
+                requests.get(url + "/metrics/pool", timeout=1)
+                ready = True
+                return server, url
+            except requests.RequestException:
+                time.sleep(0.2)
+        raise RuntimeError(f"gunicorn did not start within {READY_TIMEOUT}s")
+    finally:
+        # also on Ctrl-C while waiting
+        if not ready:
+            stop_server(server)
+
+
+def stop_server(server):
+    server.send_signal(signal.SIGTERM)
+    try:
+        server.wait(timeout=READY_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def worker_memory(server):
+    # resident memory of each gunicorn worker, read from /proc (Linux only)
+    if server is None or not os.path.isdir("/proc"):
+        return {}
+    memory = {}
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/status") as status:
+                fields = dict(line.split(":", 1) for line in status if ":" in line)
+        except OSError:
+            continue
+        if int(fields.get("PPid", "0").strip()) == server.pid:
+            memory[pid] = round(int(fields["VmRSS"].split()[0]) / 1024, 1)
+    return memory
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--goals", type=int, default=0)
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--write-concurrency", type=int,
+                        help="concurrent clients for write routes (default --concurrency)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--serve-mode", choices=["sync", "gevent"], default="sync")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--full-list-max", type=int, default=10000,
+                        help="skip unpaginated GET /tasks above this many tasks")
+    parser.add_argument("--only", type=lambda value: value.split(","),
+                        help="comma-separated scenario names")
+    parser.add_argument("--url", help="load an already running server instead")
+    parser.add_argument("--no-seed", action="store_true")
+    parser.add_argument("--output", default="load_test_results.json")
+    args = parser.parse_args()
+
+    if not args.no_seed:
+        app = make_app()
+        with app.app_context():
+            seed_tasks(args.tasks, goals=args.goals)
+
+    server = None
+    url = args.url
+    try:
+        if url is None:
+            server, url = start_server(args)
+
+        results = {
+            "commit": git_commit(),
+            "started_at": datetime.utcnow().isoformat(),
+            "config": {key: value for key, value in vars(args).items() if key != "output"},
+            "memory_mb_before": worker_memory(server),
+            "routes": {},
+        }
+        print(f"{'route':>22} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'errors':>7}")
+        ordered = sorted(scenarios(args), key=lambda scenario: not scenario.read_only)
+        for scenario in ordered:
+            if scenario.prepare:
+                scenario.prepare(url)
+            result = run_scenario(scenario, url, args)
+            results["routes"][scenario.name] = result
+            print(f"{scenario.name:>22} {result['requests_per_second']:>9.1f} "
+                  f"{result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                  f"{result['p99_ms']:>9.2f} {result['errors']:>7}")
+        results["memory_mb_after"] = worker_memory(server)
+    finally:
+        if server is not None:
+            stop_server(server)
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Measure what request and SQL instrumentation costs per request by
+serving the same GET /tasks/<id> and GET /tasks?limit= requests with
+METRICS_ENABLED on and off, plus the raw cost of one histogram observe().
+
+    python -m benchmarks.metrics_overhead --tasks 10000 --requests 2000
+"""
+import argparse
+import os
+import time
+
+from app.metrics import Histogram, LATENCY_BUCKETS
+from benchmarks.common import best_of, make_app, seed_tasks
+
+
+def run(enabled, args):
+    # METRICS_ENABLED is read when the app is created
+    os.environ["METRICS_ENABLED"] = "true" if enabled else "false"
+    app = make_app()
+    client = app.test_client()
+    with app.app_context():
+        seed_tasks(args.tasks)
+
+        def get_tasks():
+            for number in range(args.requests):
+                client.get(f"/tasks/{number % args.tasks + 1}")
+        single = best_of(get_tasks, args.repeat) / args.requests
+
+        def list_tasks():
+            for _ in range(args.requests // 10):
+                client.get("/tasks?limit=100")
+        page = best_of(list_tasks, args.repeat) / (args.requests // 10)
+
+    label = "enabled" if enabled else "disabled"
+    print(f"{label:>10} {single * 1e6:>20.1f} {page * 1e6:>22.1f}")
+
+
+def observe_cost(count):
+    histogram = Histogram("benchmark_seconds", "", ("method", "route"), LATENCY_BUCKETS)
+    labels = ("GET", "/tasks/<task_id>")
+    start = time.perf_counter()
+    for number in range(count):
+        histogram.observe(labels, number % 100 / 1000)
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'metrics':>10} {'GET /tasks/<id> (us)':>20} {'GET /tasks?limit (us)':>22}")
+    run(False, args)
+    run(True, args)
+    print(f"Histogram.observe: {observe_cost(100000) * 1e9:.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Show query plans and latency for the task list queries with and without
+the indexes from migration 5f2c9a1e7b43.
+
+    python -m benchmarks.task_indexes --rows 1000000
+"""
+import argparse
+
+from app import db
+from app.models.task import Task
+from benchmarks.common import best_of, make_app, seed_tasks
+
+QUERIES = {
+    "sorted first page":
+        "SELECT task_id, title FROM task ORDER BY title, task_id LIMIT 100",
+    "sorted deep page":
+        "SELECT task_id, title FROM task WHERE (title, task_id) > ('Task 00900000', 900000) "
+        "ORDER BY title, task_id LIMIT 100",
+    "sorted desc first page":
+        "SELECT task_id, title FROM task ORDER BY title DESC, task_id DESC LIMIT 100",
+    "incomplete tasks":
+        "SELECT task_id FROM task WHERE completed_at IS NULL ORDER BY task_id LIMIT 100",
+}
+
+
+def explain(sql):
+    if db.engine.dialect.name == "postgresql":
+        prefix = "EXPLAIN ANALYZE "
+    else:
+        prefix = "EXPLAIN QUERY PLAN "
+    rows = db.session.execute(prefix + sql).fetchall()
+    return "\n".join("    " + " ".join(str(column) for column in row) for row in rows)
+
+
+def run_queries(label, repeat):
+    print(f"== {label} ==")
+    for name, sql in QUERIES.items():
+        elapsed = best_of(lambda: db.session.execute(sql).fetchall(), repeat)
+        print(f"{name}: {elapsed * 1000:.2f} ms")
+        print(explain(sql))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = make_app()
+    with app.app_context():
+        seed_tasks(args.rows)
+        indexes = list(Task.__table__.indexes)
+
+        for index in indexes:
+            index.drop(db.engine)
+        db.session.execute("ANALYZE")
+        db.session.commit()
+        run_queries("without indexes", args.repeat)
+
+        for index in indexes:
+            index.create(db.engine)
+        db.session.execute("ANALYZE")
+        db.session.commit()
+        run_queries("with indexes", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare GET /tasks/search (tsvector + GIN on PostgreSQL, FTS5 on
+SQLite) against ILIKE '%word%' scans over title and description, for a
+common, an uncommon and a rare word.
+
+    python -m benchmarks.task_search --rows 1000000
+"""
+import argparse
+import random
+
+from sqlalchemy import or_
+
+from app import db
+from app.models.task import Task
+from app.routes import TASK_LIST_COLUMNS, SEARCH_PAGE_SIZE
+from app.search import search_tasks
+from benchmarks.common import SEED_BATCH_SIZE, best_of, make_app
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa", "do", "fu"]
+
+
+def vocabulary(size, rng):
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(4)))
+    return sorted(words)
+
+
+def seed_text(rows, words, rng):
+    db.drop_all()
+    db.create_all()
+    # Zipf-like word frequencies, so some words are common and most rare
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    insert = Task.__table__.insert()
+    for start in range(0, rows, SEED_BATCH_SIZE):
+        batch = []
+        for _ in range(start, min(start + SEED_BATCH_SIZE, rows)):
+            batch.append({
+                "title": " ".join(rng.choices(words, weights, k=4)),
+                "description": " ".join(rng.choices(words, weights, k=12))
+            })
+        db.session.execute(insert, batch)
+    db.session.commit()
+
+
+def ilike_search(word, limit):
+    pattern = f"%{word}%"
+    return db.session.query(*TASK_LIST_COLUMNS).filter(
+        or_(Task.title.ilike(pattern), Task.description.ilike(pattern))
+    ).order_by(Task.task_id).limit(limit).all()
+
+
+def ilike_count(word):
+    pattern = f"%{word}%"
+    return db.session.query(Task.task_id).filter(
+        or_(Task.title.ilike(pattern), Task.description.ilike(pattern))).count()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--words", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    words = vocabulary(args.words, rng)
+    app = make_app()
+    client = app.test_client()
+    with app.app_context():
+        seed_text(args.rows, words, rng)
+        db.session.execute("ANALYZE")
+        db.session.commit()
+
+        samples = {"common": words[0], "uncommon": words[len(words) // 20],
+                   "rare": words[-1]}
+        print(f"{'word':>10} {'matches':>9} {'search (ms)':>12} {'http (ms)':>10} "
+              f"{'ILIKE page (ms)':>16} {'ILIKE count (ms)':>17}")
+        for label, word in samples.items():
+            matches = ilike_count(word)
+            search = best_of(lambda: search_tasks(word, TASK_LIST_COLUMNS, SEARCH_PAGE_SIZE, 0),
+                             args.repeat)
+            http = best_of(lambda: client.get(f"/tasks/search?q={word}"), args.repeat)
+            page = best_of(lambda: ilike_search(word, SEARCH_PAGE_SIZE), args.repeat)
+            count = best_of(lambda: ilike_count(word), args.repeat)
+            print(f"{label:>10} {matches:>9} {search * 1000:>12.2f} {http * 1000:>10.2f} "
+                  f"{page * 1000:>16.2f} {count * 1000:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import argparse
+import sys
+import task_files
 import task_list
 
 OPTIONS = {
@@ -31,8 +34,7 @@ def make_choice():
 
 def get_task_from_user(msg = "Input the id of the task you would like to work with: "):
     task = None
-    tasks = task_list.list_tasks()
-    if not tasks:
+    if not task_list.has_tasks():
         task_list.print_stars("This option is not possible because there are no tasks.")
         return task
     count = 0
@@ -58,7 +60,8 @@ def print_task(task):
     print_single_row_of_stars()
 
 def print_all_tasks():
-    tasks = task_list.list_tasks()
+    # only fetches what changed since the last listing
+    tasks = task_list.sync_tasks()
     print("\nTasks:")
     if not tasks:
         print_surround_stars("No tasks")
@@ -118,9 +121,8 @@ def change_task_complete_status(status):
         print_task(response)
 
 def delete_all_tasks():
-    for task in task_list.list_tasks():
-        task_list.delete_task(task["id"])
-        print_surround_stars("Deleted all tasks.")
+    task_list.delete_all_tasks()
+    print_surround_stars("Deleted all tasks.")
 
 def run_cli():
     
@@ -151,6 +153,70 @@ def run_cli():
         elif choice=='10':
             play=False
 
+def print_progress(verb):
+    def progress(done, total):
+        count = f"{done}/{total}" if total is not None else f"{done}"
+        print(f"\r{verb} {count} tasks", end="", file=sys.stderr, flush=True)
+    return progress
+
+def import_command(args):
+    format = task_files.file_format(args.file, args.format)
+    if args.file == "-":
+        tasks = task_files.read_tasks(sys.stdin, format)
+    else:
+        with open(args.file, newline="") as file:
+            tasks = task_files.read_tasks(file, format)
+
+    task_ids = task_list.import_tasks(tasks, print_progress("Imported"))
+    print(f"\nImported {len(task_ids)} tasks.", file=sys.stderr)
+
+def export_command(args):
+    format = task_files.file_format(args.output, args.format)
+    tasks = task_list.export_tasks(print_progress("Exported"))
+    if args.output == "-":
+        count = task_files.write_tasks(tasks, sys.stdout, format)
+    else:
+        with open(args.output, "w", newline="") as file:
+            count = task_files.write_tasks(tasks, file, format)
+    print(f"\nExported {count} tasks.", file=sys.stderr)
+
+def delete_all_command(args):
+    if not args.yes:
+        print("Refusing to delete every task without --yes.", file=sys.stderr)
+        return 1
+    count = task_list.delete_all_tasks(print_progress("Deleted"))
+    print(f"\nDeleted {count} tasks.", file=sys.stderr)
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        description="Task List CLI. Run without a command for the interactive menu.")
+    parser.add_argument("--url", default=task_list.url, help="task list API address")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="create tasks from a CSV or JSON file")
+    import_parser.add_argument("file", help="file to read, - for stdin")
+    import_parser.add_argument("--format", choices=["csv", "json"],
+                               help="defaults to the file extension, json for stdin")
+    import_parser.set_defaults(run=import_command)
+
+    export_parser = commands.add_parser("export", help="write every task to a CSV or JSON file")
+    export_parser.add_argument("-o", "--output", default="-", help="file to write, - for stdout")
+    export_parser.add_argument("--format", choices=["csv", "json"],
+                               help="defaults to the file extension, json for stdout")
+    export_parser.set_defaults(run=export_command)
+
+    delete_parser = commands.add_parser("delete-all", help="delete every task")
+    delete_parser.add_argument("--yes", action="store_true", help="confirm deleting every task")
+    delete_parser.set_defaults(run=delete_all_command)
+
+    return parser.parse_args(argv)
+
+# with a command line the CLI runs one command and exits, so it can be
+# scripted; without one it starts the interactive menu
+if len(sys.argv) > 1:
+    args = parse_args(sys.argv[1:])
+    task_list.url = args.url
+    sys.exit(args.run(args))
 
 print("Welcome to Task List CLI")
 print("These are the actions you can take:")
@@ -0,0 +1,43 @@
+import csv
+import json
+
+CSV_FIELDS = ["id", "title", "description", "is_complete"]
+
+def file_format(path, format=None):
+    if format:
+        return format
+    return "csv" if path.lower().endswith(".csv") else "json"
+
+def parse_bool(value):
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+def read_tasks(file, format):
+    # JSON is a list of task objects as returned by GET /tasks; CSV needs
+    # a title column and may have description and is_complete columns
+    if format == "json":
+        tasks = json.load(file)
+    else:
+        tasks = list(csv.DictReader(file))
+
+    for index, task in enumerate(tasks):
+        if not isinstance(task, dict) or not task.get("title"):
+            raise ValueError(f"Task {index + 1} has no title")
+        task["is_complete"] = parse_bool(task.get("is_complete", False))
+    return tasks
+
+def write_tasks(tasks, file, format):
+    # tasks may be a generator; rows are written as they arrive
+    count = 0
+    if format == "json":
+        file.write("[")
+        for task in tasks:
+            file.write(("," if count else "") + "\n" + json.dumps(task))
+            count += 1
+        file.write("\n]\n")
+    else:
+        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        for task in tasks:
+            writer.writerow(task)
+            count += 1
+    return count
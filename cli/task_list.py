@@ -1,59 +1,248 @@
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 url = "http://localhost:5000"
 
+# seconds to wait for the server to connect and to answer
+DEFAULT_TIMEOUT = (3.05, 30)
+# retries for connection errors and 502/503/504 on idempotent requests
+DEFAULT_RETRIES = 3
+DEFAULT_POOL_SIZE = 10
+# the server accepts at most this many tasks per bulk request
+BULK_BATCH_SIZE = 1000
+EXPORT_PAGE_SIZE = 1000
+
 def parse_response(response):
     if response.status_code >= 400:
         return None
-    
+
     return response.json()["task"]
 
+class TaskListClient:
+    # one pooled keep-alive session for every call, so scripts that make
+    # many requests pay for the TCP handshake once per connection instead
+    # of once per request; use as a context manager or call close()
+    def __init__(self, url=url, timeout=DEFAULT_TIMEOUT, retries=DEFAULT_RETRIES,
+                 pool_size=DEFAULT_POOL_SIZE):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.session = requests.Session()
+
+        # POST and PATCH are not retried: a create that timed out may
+        # already have been applied
+        retry = Retry(total=retries, backoff_factor=0.2,
+                      status_forcelist=(502, 503, 504), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                              max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # local copy of the task list, kept current by sync_tasks()
+        self.tasks = {}
+        self.version = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.session.close()
+
+    def request(self, method, path, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, self.url + path, **kwargs)
+
+    def create_task(self, title, description, completed_at=None):
+        query_params = {
+            "title": title,
+            "description": description,
+            "completed_at": completed_at
+        }
+        response = self.request("POST", "/tasks", json=query_params)
+        return parse_response(response)
+
+    def list_tasks(self, **filters):
+        response = self.request("GET", "/tasks", params=filters)
+        return response.json()
+
+    def sync_tasks(self):
+        # the first call downloads every task; later calls only fetch what
+        # changed since the version of the previous one
+        params = {} if self.version is None else {"since": self.version}
+        response = self.request("GET", "/tasks/changes", params=params)
+        changes = response.json()
+
+        if changes["full"]:
+            self.tasks = {}
+        for task_id in changes["deleted_ids"]:
+            self.tasks.pop(task_id, None)
+        for task in changes["tasks"]:
+            self.tasks[task["id"]] = task
+        self.version = changes["version"]
+
+        return [self.tasks[task_id] for task_id in sorted(self.tasks)]
+
+    def has_tasks(self):
+        response = self.request("GET", "/tasks", params={"limit": 1})
+        return len(response.json()["tasks"]) > 0
+
+    def get_task(self, id):
+        response = self.request("GET", f"/tasks/{id}")
+        if response.status_code != 200:
+            return None
+
+        return parse_response(response)
+
+    def update_task(self, id, title, description):
+        query_params = {
+            "title": title,
+            "description": description
+        }
+        response = self.request("PUT", f"/tasks/{id}", json=query_params)
+        return parse_response(response)
+
+    def delete_task(self, id):
+        response = self.request("DELETE", f"/tasks/{id}")
+        return response.json()
+
+    def delete_all_tasks(self, progress=None):
+        # the bulk route deletes at most BULK_BATCH_SIZE tasks per request,
+        # so the ids are collected first and deleted a batch at a time
+        task_ids = [task["id"] for task in self.export_tasks()]
+        deleted = 0
+        for start in range(0, len(task_ids), BULK_BATCH_SIZE):
+            batch = task_ids[start:start + BULK_BATCH_SIZE]
+            response = self.request("DELETE", "/tasks/bulk", json={"task_ids": batch})
+            # servers without the bulk routes send DELETE /tasks/bulk to
+            # /tasks/<task_id> and reject "bulk" as an id
+            if response.status_code in (400, 404, 405):
+                self.run_concurrently(
+                    lambda task_id: self.request("DELETE", f"/tasks/{task_id}"),
+                    task_ids[start:], progress, done=start, total=len(task_ids))
+                return deleted + len(task_ids) - start
+            response.raise_for_status()
+            deleted += len(response.json()["matched_ids"])
+            if progress:
+                progress(start + len(batch), len(task_ids))
+        return deleted
+
+    def import_tasks(self, tasks, progress=None):
+        # tasks are dicts with title, description and optionally
+        # is_complete; returns the ids of the created tasks in order
+        bodies = []
+        for task in tasks:
+            body = {"title": task["title"], "description": task.get("description", "")}
+            if task.get("is_complete"):
+                body["completed_at"] = True
+            bodies.append(body)
+
+        batches = [bodies[start:start + BULK_BATCH_SIZE]
+                   for start in range(0, len(bodies), BULK_BATCH_SIZE)]
+        task_ids = []
+        for batch in batches:
+            response = self.request("POST", "/tasks/bulk", json=batch)
+            if response.status_code in (404, 405):
+                # no bulk endpoint: one request per remaining task
+                remaining = bodies[len(task_ids):]
+                created = self.run_concurrently(
+                    lambda body: self.request("POST", "/tasks", json=body),
+                    remaining, progress, done=len(task_ids), total=len(bodies))
+                return task_ids + [parse_response(response)["id"] for response in created]
+            response.raise_for_status()
+            task_ids.extend(response.json()["task_ids"])
+            if progress:
+                progress(len(task_ids), len(bodies))
+        return task_ids
+
+    def export_tasks(self, progress=None):
+        # yields every task a page at a time, so exports of large lists
+        # never hold the whole list in memory
+        params = {"limit": EXPORT_PAGE_SIZE}
+        exported = 0
+        while True:
+            response = self.request("GET", "/tasks", params=params)
+            response.raise_for_status()
+            page = response.json()
+            if isinstance(page, list):
+                # servers without paging ignore limit and send every task
+                yield from page
+                if progress:
+                    progress(len(page), None)
+                return
+            yield from page["tasks"]
+            exported += len(page["tasks"])
+            if progress:
+                progress(exported, None)
+            if not page["next_cursor"]:
+                return
+            params["cursor"] = page["next_cursor"]
+
+    def run_concurrently(self, send, items, progress=None, done=0, total=None):
+        # bounded by the connection pool so workers never wait on a socket
+        total = done + len(items) if total is None else total
+        responses = []
+        with ThreadPoolExecutor(max_workers=self.pool_size) as pool:
+            for response in pool.map(send, items):
+                response.raise_for_status()
+                responses.append(response)
+                if progress:
+                    progress(done + len(responses), total)
+        return responses
+
+    def mark_complete(self, id):
+        response = self.request("PATCH", f"/tasks/{id}/mark_complete")
+        return parse_response(response)
+
+    def mark_incomplete(self, id):
+        response = self.request("PATCH", f"/tasks/{id}/mark_incomplete")
+        return parse_response(response)
+
+# module level functions share one client for the configured url
+_client = None
+
+def default_client():
+    global _client
+    if _client is None or _client.url != url.rstrip("/"):
+        _client = TaskListClient(url)
+    return _client
+
 def create_task(title, description, completed_at=None):
-    query_params = {
-        "title": title,
-        "description": description,
-        "completed_at": completed_at
-    }
-    response = requests.post(url+"/tasks",json=query_params)
-    return parse_response(response)
-
-def list_tasks():
-    response = requests.get(url+"/tasks")
-    return response.json()
+    return default_client().create_task(title, description, completed_at)
 
-def get_task(id):
-    response = requests.get(url+f"/tasks/{id}")
-    if response.status_code != 200:
-        return None
-        
-    return parse_response(response)
+def list_tasks(**filters):
+    return default_client().list_tasks(**filters)
 
-def update_task(id,title,description):
+def sync_tasks():
+    return default_client().sync_tasks()
 
-    query_params = {
-        "title": title,
-        "description": description
-    }
+def has_tasks():
+    return default_client().has_tasks()
 
-    response = requests.put(
-        url+f"/tasks/{id}",
-        json=query_params
-        )
+def get_task(id):
+    return default_client().get_task(id)
 
-    return parse_response(response)
+def update_task(id,title,description):
+    return default_client().update_task(id, title, description)
 
 def delete_task(id):
-    response = requests.delete(url+f"/tasks/{id}")
-    return response.json()
+    return default_client().delete_task(id)
 
-def mark_complete(id):
-    response = requests.patch(url+f"/tasks/{id}/mark_complete")
-    return parse_response(response)
+def delete_all_tasks(progress=None):
+    return default_client().delete_all_tasks(progress)
 
-def mark_incomplete(id):
-    response = requests.patch(url+f"/tasks/{id}/mark_incomplete")
-    return parse_response(response)
+def import_tasks(tasks, progress=None):
+    return default_client().import_tasks(tasks, progress)
 
+def export_tasks(progress=None):
+    return default_client().export_tasks(progress)
 
+def mark_complete(id):
+    return default_client().mark_complete(id)
 
-    
+def mark_incomplete(id):
+    return default_client().mark_incomplete(id)
@@ -0,0 +1,23 @@
+# Async serving mode: gevent workers handle many concurrent connections
+# each while the app and its routes stay unchanged.
+#
+#   pip install -r requirements-async.txt
+#   gunicorn -c gunicorn_async.conf.py "app:create_app()"
+#
+# Size SQLALCHEMY_POOL_SIZE for the number of requests that may hit the
+# database at once per worker; greenlets beyond that wait for a connection.
+import multiprocessing
+import os
+
+worker_class = "gevent"
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = int(os.environ.get("WORKER_CONNECTIONS", 1000))
+bind = os.environ.get("BIND", "0.0.0.0:" + os.environ.get("PORT", "5000"))
+
+
+def post_worker_init(worker):
+    # post_fork would run before the gevent worker's init_process() monkey
+    # patches the stdlib; this runs after it, just before the worker starts
+    # serving. psycopg2 needs its own hook to yield while waiting on Postgres
+    from app.green import patch_psycopg2
+    patch_psycopg2()
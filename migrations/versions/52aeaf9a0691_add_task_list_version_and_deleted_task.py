@@ -0,0 +1,38 @@
+"""add task list_version and deleted_task
+
+Revision ID: 52aeaf9a0691
+Revises: f3b82d4e6a15
+Create Date: 2026-10-18 02:46:28.325397
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '52aeaf9a0691'
+down_revision = 'f3b82d4e6a15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # existing tasks predate delta sync and are stamped 0; clients get
+    # them from their first, full, GET /tasks/changes
+    op.add_column('task', sa.Column('list_version', sa.BigInteger(), server_default='0', nullable=False))
+    op.create_index('ix_task_list_version', 'task', ['list_version'], unique=False)
+    op.create_table('deleted_task',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('list_version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_deleted_task_list_version', 'deleted_task', ['list_version'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_deleted_task_list_version', table_name='deleted_task')
+    op.drop_table('deleted_task')
+    op.drop_index('ix_task_list_version', table_name='task')
+    with op.batch_alter_table('task') as batch_op:
+        batch_op.drop_column('list_version')
@@ -0,0 +1,28 @@
+"""add task indexes
+
+Revision ID: 5f2c9a1e7b43
+Revises: deb8c711baf5
+Create Date: 2026-10-18 09:12:04.118254
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5f2c9a1e7b43'
+down_revision = 'deb8c711baf5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_task_title_task_id', 'task', ['title', 'task_id'], unique=False)
+    op.create_index('ix_task_incomplete', 'task', ['task_id'], unique=False,
+                    postgresql_where=sa.text('completed_at IS NULL'),
+                    sqlite_where=sa.text('completed_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_task_incomplete', table_name='task')
+    op.drop_index('ix_task_title_task_id', table_name='task')
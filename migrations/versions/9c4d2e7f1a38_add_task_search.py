@@ -0,0 +1,54 @@
+"""add task search
+
+Revision ID: 9c4d2e7f1a38
+Revises: 52aeaf9a0691
+Create Date: 2026-10-18 16:12:40.518304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4d2e7f1a38'
+down_revision = '52aeaf9a0691'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('ALTER TABLE task ADD COLUMN search_vector tsvector')
+        op.execute("UPDATE task SET search_vector = to_tsvector('pg_catalog.english', "
+                   "coalesce(title, '') || ' ' || coalesce(description, ''))")
+        op.execute('CREATE INDEX ix_task_search_vector ON task USING gin (search_vector)')
+        op.execute('CREATE TRIGGER task_search_vector_update BEFORE INSERT OR UPDATE OF title, description '
+                   'ON task FOR EACH ROW EXECUTE PROCEDURE '
+                   "tsvector_update_trigger(search_vector, 'pg_catalog.english', title, description)")
+    elif op.get_bind().dialect.name == 'sqlite':
+        op.execute("CREATE VIRTUAL TABLE task_search USING fts5("
+                   "title, description, content='task', content_rowid='task_id')")
+        op.execute("INSERT INTO task_search (task_search) VALUES ('rebuild')")
+        op.execute("CREATE TRIGGER task_search_insert AFTER INSERT ON task BEGIN "
+                   "INSERT INTO task_search (rowid, title, description) "
+                   "VALUES (new.task_id, new.title, new.description); END")
+        op.execute("CREATE TRIGGER task_search_delete AFTER DELETE ON task BEGIN "
+                   "INSERT INTO task_search (task_search, rowid, title, description) "
+                   "VALUES ('delete', old.task_id, old.title, old.description); END")
+        op.execute("CREATE TRIGGER task_search_update AFTER UPDATE OF title, description ON task BEGIN "
+                   "INSERT INTO task_search (task_search, rowid, title, description) "
+                   "VALUES ('delete', old.task_id, old.title, old.description); "
+                   "INSERT INTO task_search (rowid, title, description) "
+                   "VALUES (new.task_id, new.title, new.description); END")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP TRIGGER task_search_vector_update ON task')
+        op.execute('DROP INDEX ix_task_search_vector')
+        op.execute('ALTER TABLE task DROP COLUMN search_vector')
+    elif op.get_bind().dialect.name == 'sqlite':
+        op.execute('DROP TRIGGER task_search_update')
+        op.execute('DROP TRIGGER task_search_delete')
+        op.execute('DROP TRIGGER task_search_insert')
+        op.execute('DROP TABLE task_search')
@@ -0,0 +1,33 @@
+"""add task version and change counter
+
+Revision ID: a83d1f6c2e90
+Revises: 5f2c9a1e7b43
+Create Date: 2026-10-18 10:41:27.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a83d1f6c2e90'
+down_revision = '5f2c9a1e7b43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('task', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+    change_counter = op.create_table('change_counter',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('value', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    # seed the row up front so concurrent writers only ever UPDATE it
+    op.bulk_insert(change_counter, [{'name': 'task', 'value': 0}])
+
+
+def downgrade():
+    op.drop_table('change_counter')
+    with op.batch_alter_table('task') as batch_op:
+        batch_op.drop_column('version')
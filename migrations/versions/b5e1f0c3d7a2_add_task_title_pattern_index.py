@@ -0,0 +1,27 @@
+"""add task title pattern index
+
+Revision ID: b5e1f0c3d7a2
+Revises: 9c4d2e7f1a38
+Create Date: 2026-10-18 18:04:27.630112
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5e1f0c3d7a2'
+down_revision = '9c4d2e7f1a38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # PostgreSQL only; see TITLE_PATTERN_INDEX in app/models/task.py
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('CREATE INDEX ix_task_title_pattern ON task (title text_pattern_ops)')
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute('DROP INDEX ix_task_title_pattern')
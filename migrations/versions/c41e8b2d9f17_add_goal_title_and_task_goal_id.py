@@ -0,0 +1,33 @@
+"""add goal title and task goal_id
+
+Revision ID: c41e8b2d9f17
+Revises: a83d1f6c2e90
+Create Date: 2026-10-18 11:58:13.240967
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41e8b2d9f17'
+down_revision = 'a83d1f6c2e90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('goal', sa.Column('title', sa.String(), nullable=True))
+    with op.batch_alter_table('task') as batch_op:
+        batch_op.add_column(sa.Column('goal_id', sa.Integer(), nullable=True))
+        batch_op.create_index('ix_task_goal_id', ['goal_id'], unique=False)
+        batch_op.create_foreign_key('fk_task_goal_id_goal', 'goal', ['goal_id'], ['goal_id'])
+
+
+def downgrade():
+    with op.batch_alter_table('task') as batch_op:
+        batch_op.drop_constraint('fk_task_goal_id_goal', type_='foreignkey')
+        batch_op.drop_index('ix_task_goal_id')
+        batch_op.drop_column('goal_id')
+    with op.batch_alter_table('goal') as batch_op:
+        batch_op.drop_column('title')
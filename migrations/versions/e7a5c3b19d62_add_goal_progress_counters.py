@@ -0,0 +1,33 @@
+"""add goal progress counters
+
+Revision ID: e7a5c3b19d62
+Revises: c41e8b2d9f17
+Create Date: 2026-10-18 13:20:51.874402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a5c3b19d62'
+down_revision = 'c41e8b2d9f17'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('goal', sa.Column('task_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('goal', sa.Column('completed_count', sa.Integer(), server_default='0', nullable=False))
+    # backfill so the counters are correct whenever GOAL_PROGRESS_COUNTERS is turned on
+    op.execute(
+        "UPDATE goal SET "
+        "task_count = (SELECT count(task.task_id) FROM task WHERE task.goal_id = goal.goal_id), "
+        "completed_count = (SELECT count(task.completed_at) FROM task WHERE task.goal_id = goal.goal_id)"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('goal') as batch_op:
+        batch_op.drop_column('completed_count')
+        batch_op.drop_column('task_count')
@@ -0,0 +1,36 @@
+"""add outbox
+
+Revision ID: f3b82d4e6a15
+Revises: e7a5c3b19d62
+Create Date: 2026-10-18 14:37:09.661852
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b82d4e6a15'
+down_revision = 'e7a5c3b19d62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('sent_at', sa.DateTime(), nullable=True),
+    sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_outbox_pending', 'outbox', ['id'], unique=False,
+                    postgresql_where=sa.text('sent_at IS NULL'),
+                    sqlite_where=sa.text('sent_at IS NULL'))
+
+
+def downgrade():
+    op.drop_index('ix_outbox_pending', table_name='outbox')
+    op.drop_table('outbox')
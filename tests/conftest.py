@@ -1,3 +1,16 @@
+import os
+
+# TASK_LIST_SERVE_MODE=gevent runs the whole suite on the cooperative stack
+# used by gunicorn_async.conf.py; patching has to happen before the app and
+# the stdlib modules it uses are imported
+if os.environ.get("TASK_LIST_SERVE_MODE") == "gevent":
+    from app.green import patch_all
+    patch_all()
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
 import pytest
 from app import create_app
 from app.models.task import Task
@@ -5,12 +18,21 @@ from app.models.goal import Goal
 from app import db
 from datetime import datetime
 from flask.signals import request_finished
+# pytest_configure registers the query budget markers
+from tests.query_budget import QueryRecorder, install, pytest_configure
 
 
+# Extra config for "app". A test module overrides this fixture, or a
+# test parametrizes it, so custom apps still get "client" and its budgets
 @pytest.fixture
-def app():
+def app_config():
+    return {}
+
+
+@pytest.fixture
+def app(app_config):
     # create the app with a test config dictionary
-    app = create_app({"TESTING": True})
+    app = create_app({"TESTING": True, **app_config})
 
     @request_finished.connect_via(app)
     def expire_session(sender, response, **extra):
@@ -25,8 +47,25 @@ def app():
         db.drop_all()
 
 
+# This fixture records the SQL statements run by every request
+# made through "client" and fails the test when a request goes over
+# its endpoint's query budget or repeats a statement in a loop
+@pytest.fixture
+def queries(app, request):
+    recorder = QueryRecorder()
+    budget = request.node.get_closest_marker("query_budget")
+    if budget:
+        recorder.budget = budget.args[0]
+    recorder.allow_repeats = request.node.get_closest_marker(
+        "allow_repeated_queries") is not None
+
+    uninstall = install(app, recorder)
+    yield recorder
+    uninstall()
+
+
 @pytest.fixture
-def client(app):
+def client(app, queries):
     return app.test_client()
 
 
@@ -70,6 +109,26 @@ def completed_task(app):
     db.session.commit()
 
 
+# This fixture gets called in every test that
+# references "completed_and_incomplete_tasks"
+# This fixture creates two completed tasks with
+# known completed_at dates and one incomplete task
+@pytest.fixture
+def completed_and_incomplete_tasks(app):
+    db.session.add_all([
+        Task(
+            title="Water the garden 🌷", description="",
+            completed_at=datetime(2022, 5, 1, 9, 30)),
+        Task(
+            title="Answer forgotten email 📧", description="",
+            completed_at=None),
+        Task(
+            title="Walk the dog 🐕", description="",
+            completed_at=datetime(2022, 5, 3, 18, 0))
+    ])
+    db.session.commit()
+
+
 # This fixture gets called in every test that
 # references "one_goal"
 # This fixture creates a goal and saves it in the database
@@ -91,3 +150,52 @@ def one_task_belongs_to_one_goal(app, one_goal, one_task):
     goal = Goal.query.first()
     goal.tasks.append(task)
     db.session.commit()
+
+
+class StubSlack:
+    # stands in for chat.postMessage; replies with the queued statuses
+    # and raw bodies first, then 200 {"ok": true}
+    def __init__(self):
+        self.requests = []
+        self.statuses = []
+        self.bodies = []
+        self.delay = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers["Content-Length"])
+                stub.requests.append({
+                    "authorization": self.headers["Authorization"],
+                    "body": json.loads(self.rfile.read(length))
+                })
+                time.sleep(stub.delay)
+                status = stub.statuses.pop(0) if stub.statuses else 200
+                body = stub.bodies.pop(0) if stub.bodies else json.dumps({"ok": status == 200}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/chat.postMessage"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# This fixture gets called in every test that
+# references "slack"
+# This fixture starts a local HTTP server that stands in
+# for the Slack chat.postMessage API
+@pytest.fixture
+def slack():
+    stub = StubSlack()
+    yield stub
+    stub.close()
@@ -0,0 +1,178 @@
+import re
+import threading
+
+import pytest
+from flask import request
+from flask.signals import request_started
+from flask.testing import FlaskClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Most SQL statements any single request to an endpoint may execute, keyed
+# by (method, URL rule). Every request made through the `client` fixture is
+# checked against these; a test can tighten or loosen them for its own
+# requests with @pytest.mark.query_budget(n). Transaction control
+# (BEGIN/COMMIT/ROLLBACK/SAVEPOINT) is not counted.
+ENDPOINT_BUDGETS = {
+    ("POST", "/tasks"): 4,
+    ("POST", "/tasks/bulk"): 5,
+    ("GET", "/tasks"): 3,
+    ("GET", "/tasks/changes"): 3,
+    ("GET", "/tasks/search"): 1,
+    ("GET", "/tasks/<task_id>"): 2,
+    ("PUT", "/tasks/<task_id>"): 4,
+    ("DELETE", "/tasks/<task_id>"): 5,
+    ("PATCH", "/tasks/<task_id>/mark_complete"): 5,
+    ("PATCH", "/tasks/<task_id>/mark_incomplete"): 4,
+    ("PATCH", "/tasks/bulk/mark_complete"): 6,
+    ("PATCH", "/tasks/bulk/mark_incomplete"): 5,
+    ("DELETE", "/tasks/bulk"): 6,
+    ("POST", "/goals"): 2,
+    ("GET", "/goals"): 1,
+    ("GET", "/goals/<goal_id>"): 1,
+    ("PUT", "/goals/<goal_id>"): 3,
+    ("DELETE", "/goals/<goal_id>"): 7,
+    ("POST", "/goals/<goal_id>/tasks"): 6,
+    ("GET", "/goals/<goal_id>/tasks"): 1,
+    ("GET", "/metrics"): 0,
+    ("GET", "/metrics/pool"): 0,
+}
+
+# the same statement shape this many times in one request is treated as a
+# query issued from inside a loop (N+1), whatever the overall budget
+REPEATED_STATEMENT_LIMIT = 3
+
+TRANSACTION_CONTROL = re.compile(
+    r"^\s*(BEGIN|COMMIT|ROLLBACK|SAVEPOINT|RELEASE)\b", re.IGNORECASE)
+IN_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s)\s*,)+\s*(?:\?|%\(\w+\)s)\s*\)")
+LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement):
+    # collapse what varies between loop iterations: IN lists of different
+    # lengths, inlined literals and formatting
+    shape = IN_LIST.sub("(?)", statement)
+    shape = LITERAL.sub("?", shape)
+    return WHITESPACE.sub(" ", shape).strip()
+
+
+class RecordedRequest:
+    def __init__(self, method, path):
+        self.method = method
+        self.path = path
+        self.rule = None
+        self.statements = []
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+    def repeated_shapes(self):
+        shapes = {}
+        for statement in self.statements:
+            shape = statement_shape(statement)
+            shapes[shape] = shapes.get(shape, 0) + 1
+        return {shape: count for shape, count in shapes.items()
+                if count >= REPEATED_STATEMENT_LIMIT}
+
+    def describe(self):
+        lines = [f"{self.method} {self.path} ran {self.count} statements:"]
+        lines.extend(f"  {number}. {statement}"
+                     for number, statement in enumerate(self.statements, 1))
+        return "\n".join(lines)
+
+
+class QueryRecorder:
+    # records the statements run by the thread that is currently inside a
+    # client request; anything else (fixtures, background threads) is ignored
+    def __init__(self):
+        self.requests = []
+        self.current = None
+        self.thread = None
+        self.budget = None
+        self.allow_repeats = False
+
+    @property
+    def last(self):
+        return self.requests[-1]
+
+    def start(self, method, path):
+        self.current = RecordedRequest(method, path)
+        self.thread = threading.get_ident()
+
+    def stop(self):
+        recorded, self.current = self.current, None
+        self.requests.append(recorded)
+        return recorded
+
+    def record_statement(self, statement):
+        if self.current is not None and threading.get_ident() == self.thread \
+                and not TRANSACTION_CONTROL.match(statement):
+            self.current.statements.append(statement)
+
+    def record_rule(self):
+        if self.current is not None and request.url_rule is not None:
+            self.current.rule = request.url_rule.rule
+
+    def check(self, recorded):
+        if recorded.rule is None:
+            return
+        repeated = recorded.repeated_shapes()
+        if repeated and not self.allow_repeats:
+            shape, count = max(repeated.items(), key=lambda item: item[1])
+            pytest.fail(f"possible N+1: {recorded.method} {recorded.rule} ran the "
+                        f"same statement {count} times: {shape}\n{recorded.describe()}",
+                        pytrace=False)
+
+        budget = self.budget
+        if budget is None:
+            budget = ENDPOINT_BUDGETS.get((recorded.method, recorded.rule))
+        if budget is not None and recorded.count > budget:
+            pytest.fail(f"query budget of {budget} exceeded by "
+                        f"{recorded.method} {recorded.rule}\n{recorded.describe()}",
+                        pytrace=False)
+
+
+class QueryCountingClient(FlaskClient):
+    recorder = None
+
+    def open(self, *args, **kwargs):
+        recorder = self.recorder
+        if recorder is None or recorder.current is not None:
+            return super().open(*args, **kwargs)
+
+        method = kwargs.get("method", "GET").upper()
+        path = args[0] if args and isinstance(args[0], str) else kwargs.get("path", "/")
+        recorder.start(method, path)
+        try:
+            response = super().open(*args, **kwargs)
+        finally:
+            recorded = recorder.stop()
+        recorder.check(recorded)
+        return response
+
+
+def install(app, recorder):
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        recorder.record_statement(statement)
+
+    def record_rule(sender, **extra):
+        recorder.record_rule()
+
+    event.listen(Engine, "before_cursor_execute", before_cursor_execute)
+    request_started.connect(record_rule, app, weak=False)
+    client_class = type("RecordingClient", (QueryCountingClient,), {"recorder": recorder})
+    app.test_client_class = client_class
+
+    def uninstall():
+        event.remove(Engine, "before_cursor_execute", before_cursor_execute)
+        request_started.disconnect(record_rule, app)
+    return uninstall
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "query_budget(n): allow at most n SQL statements per client request")
+    config.addinivalue_line(
+        "markers", "allow_repeated_queries: skip the N+1 repeated statement check")
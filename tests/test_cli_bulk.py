@@ -0,0 +1,150 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import pytest
+from werkzeug.serving import make_server
+from cli import task_files
+from cli.task_list import TaskListClient
+from app.models.task import Task
+from tests.test_cli_client import StubTaskApi
+
+CLI = os.path.join(os.path.dirname(__file__), "..", "cli", "main.py")
+
+
+# This fixture serves the test app over HTTP so the CLI
+# client can talk to it
+@pytest.fixture
+def live_url(app):
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+def test_import_tasks_uses_bulk_endpoint(live_url):
+    # Arrange
+    tasks = [{"title": f"Task {number}", "description": "", "is_complete": number == 0}
+             for number in range(1500)]
+    progress = []
+
+    # Act
+    with TaskListClient(live_url) as client:
+        task_ids = client.import_tasks(tasks, lambda done, total: progress.append((done, total)))
+
+    # Assert
+    assert len(task_ids) == 1500
+    assert progress == [(1000, 1500), (1500, 1500)]
+    assert Task.query.count() == 1500
+    assert Task.query.filter(Task.completed_at.isnot(None)).count() == 1
+
+
+def test_export_tasks_pages_through_every_task(live_url, three_tasks):
+    # Act
+    with TaskListClient(live_url) as client:
+        tasks = list(client.export_tasks())
+
+    # Assert
+    assert [task["id"] for task in tasks] == [1, 2, 3]
+
+
+def test_delete_all_tasks(live_url, three_tasks):
+    # Act
+    with TaskListClient(live_url) as client:
+        deleted = client.delete_all_tasks()
+
+    # Assert
+    assert deleted == 3
+    assert Task.query.count() == 0
+
+
+def test_delete_all_tasks_in_batches(live_url):
+    # Arrange
+    progress = []
+    with TaskListClient(live_url) as client:
+        client.import_tasks([{"title": f"Task {number}"} for number in range(1500)])
+
+    # Act
+    with TaskListClient(live_url) as client:
+        deleted = client.delete_all_tasks(lambda done, total: progress.append((done, total)))
+
+    # Assert
+    assert deleted == 1500
+    assert progress == [(1000, 1500), (1500, 1500)]
+    assert Task.query.count() == 0
+
+
+def test_import_tasks_falls_back_to_single_creates():
+    # Arrange
+    stub = StubTaskApi()
+    stub.statuses = [405]
+
+    # Act
+    with TaskListClient(stub.url, pool_size=2) as client:
+        task_ids = client.import_tasks([{"title": "One"}, {"title": "Two"}])
+    stub.close()
+
+    # Assert
+    assert task_ids == [1, 1]
+    assert len(stub.ports) == 3
+
+
+def test_delete_all_tasks_falls_back_to_single_deletes():
+    # Arrange
+    stub = StubTaskApi()
+    stub.statuses = [200, 400]
+    stub.bodies = [[{"id": 1, "title": "One"}, {"id": 2, "title": "Two"}],
+                   {"details": "Task bulk invalid"}]
+
+    # Act
+    with TaskListClient(stub.url, pool_size=2) as client:
+        deleted = client.delete_all_tasks()
+    stub.close()
+
+    # Assert
+    assert deleted == 2
+    assert len(stub.ports) == 4
+
+
+def test_read_and_write_csv_round_trip():
+    # Arrange
+    tasks = [{"id": 1, "title": "Water the garden 🌷", "description": "", "is_complete": True}]
+    file = io.StringIO()
+
+    # Act
+    task_files.write_tasks(iter(tasks), file, "csv")
+    file.seek(0)
+    read = task_files.read_tasks(file, "csv")
+
+    # Assert
+    assert read[0]["title"] == "Water the garden 🌷"
+    assert read[0]["is_complete"] is True
+
+
+def test_read_tasks_requires_title():
+    # Act
+    with pytest.raises(ValueError) as error:
+        task_files.read_tasks(io.StringIO('[{"description": "no title"}]'), "json")
+
+    # Assert
+    assert str(error.value) == "Task 1 has no title"
+
+
+def test_cli_export_and_delete_all_commands(live_url, three_tasks):
+    # Act
+    export = subprocess.run([sys.executable, CLI, "--url", live_url, "export"],
+                            capture_output=True, text=True)
+    refused = subprocess.run([sys.executable, CLI, "--url", live_url, "delete-all"],
+                             capture_output=True, text=True)
+    deleted = subprocess.run([sys.executable, CLI, "--url", live_url, "delete-all", "--yes"],
+                             capture_output=True, text=True)
+
+    # Assert
+    assert export.returncode == 0
+    assert [task["id"] for task in json.loads(export.stdout)] == [1, 2, 3]
+    assert refused.returncode == 1
+    assert deleted.returncode == 0
+    assert "Deleted 3 tasks." in deleted.stderr
+    assert Task.query.count() == 0
@@ -0,0 +1,106 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+import pytest
+import requests
+from cli.task_list import TaskListClient
+
+
+class StubTaskApi:
+    # answers every request with a task body after replying with the
+    # queued statuses and bodies first; records the client port of each
+    # request
+    def __init__(self):
+        self.ports = []
+        self.statuses = []
+        self.bodies = []
+        self.delay = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def reply(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                stub.ports.append(self.client_address[1])
+                time.sleep(stub.delay)
+                status = stub.statuses.pop(0) if stub.statuses else 200
+                body = stub.bodies.pop(0) if stub.bodies else {"task": {"id": 1, "title": "Stub"}}
+                body = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_PUT = do_POST = do_PATCH = do_DELETE = reply
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        # a client that timed out has hung up; nothing to report
+        self.server.handle_error = lambda request, client_address: None
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def task_api():
+    stub = StubTaskApi()
+    yield stub
+    stub.close()
+
+
+def test_client_reuses_one_connection(task_api):
+    # Act
+    with TaskListClient(task_api.url) as client:
+        client.get_task(1)
+        client.update_task(1, "Title", "Description")
+        client.mark_complete(1)
+
+    # Assert
+    assert len(task_api.ports) == 3
+    assert len(set(task_api.ports)) == 1
+
+
+def test_client_retries_unavailable_server(task_api):
+    # Arrange
+    task_api.statuses = [503, 503]
+
+    # Act
+    with TaskListClient(task_api.url) as client:
+        task = client.get_task(1)
+
+    # Assert
+    assert task == {"id": 1, "title": "Stub"}
+    assert len(task_api.ports) == 3
+
+
+def test_client_does_not_retry_post(task_api):
+    # Arrange
+    task_api.statuses = [503]
+
+    # Act
+    with TaskListClient(task_api.url) as client:
+        task = client.create_task("Title", "Description")
+
+    # Assert
+    assert task is None
+    assert len(task_api.ports) == 1
+
+
+def test_client_times_out(task_api):
+    # Arrange
+    task_api.delay = 0.5
+
+    # Act
+    with TaskListClient(task_api.url, timeout=0.1, retries=0) as client:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get_task(1)
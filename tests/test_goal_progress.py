@@ -0,0 +1,72 @@
+import pytest
+from app import db
+from app.models.goal import Goal
+from app.models.task import Task
+
+
+@pytest.fixture(params=[False, True], ids=["aggregate", "counters"])
+def app_config(request):
+    return {"GOAL_PROGRESS_COUNTERS": request.param}
+
+
+@pytest.fixture
+def two_goals_and_three_tasks(app):
+    db.session.add_all([
+        Goal(title="Build a habit of going outside daily"),
+        Goal(title="Inbox zero")
+    ])
+    db.session.add_all([
+        Task(title="Water the garden 🌷", description="", completed_at=None),
+        Task(title="Answer forgotten email 📧", description="", completed_at=None),
+        Task(title="Pay my outstanding tickets 😭", description="", completed_at=None)
+    ])
+    db.session.commit()
+
+
+def goal_progress(client):
+    return {
+        goal["id"]: (goal["completed_count"], goal["task_count"])
+        for goal in client.get("/goals?progress=true").get_json()
+    }
+
+
+def test_get_goals_progress(client, two_goals_and_three_tasks):
+    # Arrange
+    client.post("/goals/1/tasks", json={"task_ids": [1, 2, 3]})
+    client.patch("/tasks/1/mark_complete")
+
+    # Act
+    response = client.get("/goals?progress=true")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == [
+        {
+            "id": 1,
+            "title": "Build a habit of going outside daily",
+            "task_count": 3,
+            "completed_count": 1
+        },
+        {
+            "id": 2,
+            "title": "Inbox zero",
+            "task_count": 0,
+            "completed_count": 0
+        }
+    ]
+
+
+def test_get_goals_progress_follows_writes(client, two_goals_and_three_tasks):
+    # Arrange
+    client.post("/goals/1/tasks", json={"task_ids": [1, 2, 3]})
+    client.patch("/tasks/bulk/mark_complete", json={"task_ids": [1, 2]})
+    client.patch("/tasks/1/mark_incomplete")
+    client.post("/goals/2/tasks", json={"task_ids": [3]})
+    client.delete("/tasks/2")
+
+    # Act
+    progress = goal_progress(client)
+
+    # Assert
+    assert progress == {1: (0, 1), 2: (0, 1)}
@@ -0,0 +1,70 @@
+import pytest
+from sqlalchemy import event
+from app import db
+from app.models.task import Task
+
+
+def test_get_tasks_for_specific_goal_single_query(client, one_goal, three_tasks):
+    # Arrange
+    client.post("/goals/1/tasks", json={"task_ids": [1, 2, 3]})
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count_statement)
+
+    # Act
+    try:
+        response = client.get("/goals/1/tasks")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count_statement)
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["id"] for task in response_body["tasks"]] == [1, 2, 3]
+    assert len(statements) == 1
+
+
+def test_post_task_ids_to_goal_missing_task(client, one_goal, three_tasks):
+    # Act
+    response = client.post("/goals/1/tasks", json={"task_ids": [1, 9]})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 404
+    assert response_body == {"details": "No task with id '9' found."}
+    assert Task.query.get(1).goal_id is None
+
+
+def test_post_task_ids_to_missing_goal(client, three_tasks):
+    # Act
+    response = client.post("/goals/1/tasks", json={"task_ids": [1]})
+
+    # Assert
+    assert response.status_code == 404
+    assert Task.query.get(1).goal_id is None
+
+
+@pytest.mark.parametrize("request_kwargs", [{"json": [1, 2]}, {"json": "1"}, {}])
+def test_post_task_ids_to_goal_without_object_body(client, one_goal, three_tasks, request_kwargs):
+    # Act
+    response = client.post("/goals/1/tasks", **request_kwargs)
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {"details": "Request body must include task_ids"}
+    assert Task.query.get(1).goal_id is None
+
+
+def test_delete_goal_keeps_its_tasks(client, one_task_belongs_to_one_goal):
+    # Act
+    response = client.delete("/goals/1")
+    task_response = client.get("/tasks/1")
+
+    # Assert
+    assert response.status_code == 200
+    assert task_response.status_code == 200
+    assert "goal_id" not in task_response.get_json()["task"]
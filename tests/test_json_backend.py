@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from flask import json
+from app import create_app
+from app.json_backend import StdlibJSONEncoder, json_encoder
+
+DOCUMENT = {
+    "tasks": [{"id": 1, "title": "Water the garden 🌷", "is_complete": True}],
+    "completed_at": datetime(2022, 5, 1, 9, 30),
+    "aware": datetime(2022, 5, 1, 11, 30, 15, 250, tzinfo=timezone(timedelta(hours=2))),
+    "next_cursor": None
+}
+
+# orjson is optional and not in requirements.txt
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+
+
+def encode(backend, document):
+    app = create_app({"TESTING": True, "JSON_BACKEND": backend})
+    with app.app_context():
+        return json.dumps(document)
+
+
+@requires_orjson
+def test_auto_backend_prefers_orjson():
+    # Act
+    encoder = json_encoder("auto")
+
+    # Assert
+    assert encoder.__name__ == "OrjsonJSONEncoder"
+
+
+def test_stdlib_backend():
+    # Act
+    app = create_app({"TESTING": True, "JSON_BACKEND": "stdlib"})
+
+    # Assert
+    assert app.json_encoder is StdlibJSONEncoder
+
+
+def test_unknown_backend():
+    # Act
+    with pytest.raises(RuntimeError) as error:
+        create_app({"TESTING": True, "JSON_BACKEND": "yaml"})
+
+    # Assert
+    assert str(error.value) == "Unknown JSON_BACKEND 'yaml'. Expected one of auto, orjson, stdlib."
+
+
+@requires_orjson
+def test_backends_encode_the_same_document():
+    # Act
+    fast = encode("orjson", DOCUMENT)
+    stdlib = encode("stdlib", DOCUMENT)
+
+    # Assert
+    assert json.loads(fast) == json.loads(stdlib)
+    assert json.loads(fast)["completed_at"] == "2022-05-01T09:30:00+00:00"
+    assert json.loads(fast)["aware"] == "2022-05-01T11:30:15.000250+02:00"
+
+
+@requires_orjson
+def test_orjson_backend_falls_back_for_big_integers():
+    # Act
+    encoded = encode("orjson", {"value": 2 ** 70})
+
+    # Assert
+    assert json.loads(encoded) == {"value": 2 ** 70}
+
+
+@pytest.mark.parametrize("app_config", [
+    pytest.param({"JSON_BACKEND": "orjson"}, id="orjson", marks=requires_orjson),
+    pytest.param({"JSON_BACKEND": "stdlib"}, id="stdlib")
+])
+def test_get_tasks_with_each_backend(client, three_tasks):
+    # Act
+    response = client.get("/tasks")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.get_json()[0] == {
+        "id": 1, "title": "Water the garden 🌷", "description": "", "is_complete": False
+    }
@@ -0,0 +1,87 @@
+import pytest
+
+
+def metric_value(body, sample):
+    for line in body.splitlines():
+        if line.startswith(sample + " "):
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_metrics_count_requests_by_route_and_status(client, one_task):
+    # Arrange
+    client.get("/tasks/1")
+    client.get("/tasks/1")
+    client.get("/tasks/99")
+
+    # Act
+    response = client.get("/metrics")
+    body = response.get_data(as_text=True)
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert metric_value(
+        body, 'http_requests_total{method="GET",route="/tasks/<task_id>",status="200"}') == 2
+    assert metric_value(
+        body, 'http_requests_total{method="GET",route="/tasks/<task_id>",status="404"}') == 1
+    assert metric_value(
+        body, 'http_request_duration_seconds_count{method="GET",route="/tasks/<task_id>"}') == 3
+    assert metric_value(
+        body, 'http_request_duration_seconds_bucket{method="GET",route="/tasks/<task_id>",le="+Inf"}') == 3
+
+
+def test_metrics_record_sql_statements_per_request(client, three_tasks):
+    # Arrange
+    client.get("/tasks")
+
+    # Act
+    body = client.get("/metrics").get_data(as_text=True)
+
+    # Assert
+    count = metric_value(body, 'http_request_sql_statements_count{method="GET",route="/tasks"}')
+    total = metric_value(body, 'http_request_sql_statements_sum{method="GET",route="/tasks"}')
+    assert count == 1
+    assert total >= 1
+    assert metric_value(
+        body, 'http_request_sql_statements_bucket{method="GET",route="/tasks",le="0"}') == 0
+
+
+def test_metrics_label_unmatched_paths_together(client):
+    # Arrange
+    client.get("/no-such-page")
+    client.get("/another-missing-page")
+
+    # Act
+    body = client.get("/metrics").get_data(as_text=True)
+
+    # Assert
+    assert metric_value(
+        body, 'http_requests_total{method="GET",route="unmatched",status="404"}') == 2
+    assert "no-such-page" not in body
+
+
+def test_metrics_include_pool_cache_and_notifier_metrics(client):
+    # Act
+    body = client.get("/metrics").get_data(as_text=True)
+
+    # Assert
+    assert "# TYPE task_cache_hits_total counter" in body
+    assert "# TYPE notifications_total counter" in body
+    assert metric_value(body, 'notifications_total{outcome="sent"}') == 0
+    assert "# TYPE http_request_duration_seconds histogram" in body
+
+
+@pytest.mark.parametrize("app_config", [{"METRICS_ENABLED": False}])
+def test_metrics_can_be_disabled(client):
+    # Arrange
+    client.get("/tasks")
+
+    # Act
+    response = client.get("/metrics")
+    body = response.get_data(as_text=True)
+
+    # Assert
+    assert response.status_code == 200
+    assert "http_requests_total" not in body
+    assert "task_cache_hits_total" in body
@@ -0,0 +1,124 @@
+import pytest
+from app import db
+from app.models.outbox_event import OutboxEvent
+from app.models.task import Task
+from app.outbox import relay_batch
+
+
+@pytest.fixture
+def app_config(slack):
+    return {
+        "OUTBOX_ENABLED": True,
+        "OUTBOX_MAX_ATTEMPTS": 2,
+        "SLACK_BOT_TOKEN": "xoxb-test",
+        "SLACK_API_URL": slack.url,
+        "NOTIFY_MAX_RETRIES": 0
+    }
+
+
+@pytest.fixture
+def two_tasks(app):
+    db.session.add_all([
+        Task(title="My Beautiful Task", description="", completed_at=None),
+        Task(title="Water the garden 🌷", description="", completed_at=None)
+    ])
+    db.session.commit()
+
+
+def test_mark_complete_writes_outbox_event(app, client, slack, two_tasks):
+    # Act
+    response = client.patch("/tasks/1/mark_complete")
+
+    # Assert
+    assert response.status_code == 200
+    events = OutboxEvent.query.all()
+    assert len(events) == 1
+    assert events[0].event_type == "task.completed"
+    assert events[0].payload == {"task_id": 1, "title": "My Beautiful Task"}
+    assert events[0].sent_at is None
+    assert slack.requests == []
+
+
+def test_mark_complete_missing_task_writes_no_event(client, two_tasks):
+    # Act
+    response = client.patch("/tasks/9/mark_complete")
+
+    # Assert
+    assert response.status_code == 404
+    assert OutboxEvent.query.count() == 0
+
+
+def test_bulk_mark_complete_writes_outbox_events(client, two_tasks):
+    # Act
+    client.patch("/tasks/bulk/mark_complete", json={
+        "task_ids": [1, 2]
+    })
+
+    # Assert
+    assert sorted(event.payload["task_id"] for event in OutboxEvent.query) == [1, 2]
+
+
+def test_relay_sends_pending_events_once(app, client, slack, two_tasks):
+    # Arrange
+    client.patch("/tasks/1/mark_complete")
+    client.patch("/tasks/2/mark_complete")
+    notifier = app.extensions["notifier"]
+
+    # Act
+    first = relay_batch(notifier, batch_size=10)
+    second = relay_batch(notifier, batch_size=10)
+
+    # Assert
+    assert (first, second) == (2, 0)
+    assert [request["body"]["text"] for request in slack.requests] == [
+        "Someone just completed the task My Beautiful Task\n"
+        "Someone just completed the task Water the garden 🌷"
+    ]
+    assert all(event.sent_at for event in OutboxEvent.query)
+
+
+def test_relay_keeps_failed_events_until_max_attempts(app, client, slack, two_tasks):
+    # Arrange
+    client.patch("/tasks/1/mark_complete")
+    notifier = app.extensions["notifier"]
+    slack.statuses = [500, 500]
+
+    # Act
+    results = [relay_batch(notifier, batch_size=10) for _ in range(3)]
+
+    # Assert
+    assert results == [0, 0, 0]
+    assert len(slack.requests) == 2
+    event = OutboxEvent.query.one()
+    assert event.sent_at is None
+    assert event.attempts == 2
+
+
+def test_relay_releases_events_after_response_that_is_not_json(app, client, slack, two_tasks):
+    # Arrange
+    client.patch("/tasks/1/mark_complete")
+    notifier = app.extensions["notifier"]
+    slack.bodies = [b"<html>Bad gateway</html>"]
+
+    # Act
+    results = [relay_batch(notifier, batch_size=10) for _ in range(2)]
+
+    # Assert
+    assert results == [0, 1]
+    assert len(slack.requests) == 2
+    event = OutboxEvent.query.one()
+    assert event.sent_at is not None
+    assert event.attempts == 2
+
+
+def test_relay_command_drains_outbox(app, client, slack, two_tasks):
+    # Arrange
+    client.patch("/tasks/1/mark_complete")
+
+    # Act
+    result = app.test_cli_runner().invoke(args=["outbox", "relay", "--once"])
+
+    # Assert
+    assert result.exit_code == 0
+    assert "Relayed 1 events" in result.output
+    assert len(slack.requests) == 1
@@ -0,0 +1,52 @@
+import pytest
+from app.pool import TimedQueuePool, engine_options
+
+
+@pytest.fixture
+def app_config():
+    return {"SQLALCHEMY_ENGINE_OPTIONS": {"poolclass": TimedQueuePool, "pool_size": 2}}
+
+
+def test_get_pool_metrics(client):
+    # Arrange
+    client.get("/tasks")
+
+    # Act
+    response = client.get("/metrics/pool")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    database = response_body["database"]
+    assert database["pool"] == "TimedQueuePool"
+    assert database["size"] == 2
+    assert database["checkouts"] >= 1
+    assert database["timeouts"] == 0
+    assert "wait_seconds_max" in database
+    assert response_body["task_cache"]["hits"] == 0
+
+
+def test_engine_options_from_environment(monkeypatch):
+    # Arrange
+    monkeypatch.setenv("SQLALCHEMY_POOL_SIZE", "20")
+    monkeypatch.setenv("SQLALCHEMY_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("SQLALCHEMY_POOL_PRE_PING", "false")
+    monkeypatch.setenv("SQLALCHEMY_STATEMENT_TIMEOUT", "5000")
+
+    # Act
+    options = engine_options("postgresql://postgres@localhost/task_list_api")
+
+    # Assert
+    assert options["poolclass"] is TimedQueuePool
+    assert options["pool_size"] == 20
+    assert options["max_overflow"] == 0
+    assert options["pool_pre_ping"] is False
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+
+def test_engine_options_leave_sqlite_alone():
+    # Act
+    options = engine_options("sqlite:///tasks.db")
+
+    # Assert
+    assert options == {}
@@ -0,0 +1,87 @@
+import pytest
+from app import db
+from app.models.goal import Goal
+from app.models.task import Task
+from tests.query_budget import QueryRecorder, RecordedRequest, statement_shape
+
+
+def recorded_request(statements):
+    recorded = RecordedRequest("GET", "/goals")
+    recorded.rule = "/goals"
+    recorded.statements = statements
+    return recorded
+
+
+def test_queries_records_statements_per_request(client, one_task):
+    # Act
+    client.get("/tasks/1")
+    client.get("/goals")
+
+    # Assert
+    assert client.recorder.requests[0].rule == "/tasks/<task_id>"
+    assert client.recorder.requests[0].count == 1
+    assert client.recorder.last.rule == "/goals"
+    assert client.recorder.last.count == 1
+
+
+def test_queries_ignore_fixture_setup(client, three_tasks, queries):
+    # Assert
+    assert queries.requests == []
+
+
+@pytest.mark.query_budget(0)
+def test_query_budget_marker_fails_request_over_budget(client):
+    # Act
+    with pytest.raises(pytest.fail.Exception) as error:
+        client.get("/goals")
+
+    # Assert
+    assert "query budget of 0 exceeded by GET /goals" in str(error.value)
+
+
+def test_statement_shape_ignores_values_and_in_list_length():
+    # Act
+    short = statement_shape("SELECT * FROM task WHERE task.task_id IN (?, ?)")
+    long = statement_shape("SELECT *\n FROM task WHERE task.task_id IN (?, ?, ?, ?)")
+
+    # Assert
+    assert short == long
+    assert statement_shape("SELECT * FROM goal WHERE goal_id = 1") == \
+        statement_shape("SELECT * FROM goal WHERE goal_id = 2")
+
+
+def test_repeated_statement_is_reported_as_n_plus_one():
+    # Arrange
+    recorder = QueryRecorder()
+    recorded = recorded_request(
+        ["SELECT goal.goal_id FROM goal"] +
+        ["SELECT task.task_id FROM task WHERE ? = task.goal_id"] * 3)
+
+    # Act
+    with pytest.raises(pytest.fail.Exception) as error:
+        recorder.check(recorded)
+
+    # Assert
+    assert "possible N+1: GET /goals ran the same statement 3 times" in str(error.value)
+
+
+def test_lazy_loading_in_a_loop_is_caught(app, queries):
+    # Arrange
+    db.session.add_all([Goal(title=f"Goal {number}") for number in range(3)])
+    db.session.add_all([Task(title="Task", description="", goal_id=number)
+                        for number in range(1, 4)])
+    db.session.commit()
+    db.session.remove()
+
+    queries.start("GET", "/goals")
+    for goal in Goal.query.all():
+        goal.tasks
+    recorded = queries.stop()
+    recorded.rule = "/goals"
+
+    # Act
+    with pytest.raises(pytest.fail.Exception) as error:
+        queries.check(recorded)
+
+    # Assert
+    assert "possible N+1" in str(error.value)
@@ -0,0 +1,104 @@
+import pytest
+from app import db
+from app.models.change_counter import ChangeCounter
+from app.models.task import Task
+
+
+# list_version of task 1, and the change counter, on each replica; a test
+# parametrizes this to change the number of replicas
+@pytest.fixture
+def replica_versions():
+    return [1]
+
+
+@pytest.fixture
+def app_config(tmp_path, replica_versions):
+    return {
+        "SQLALCHEMY_REPLICA_URIS": [
+            f"sqlite:///{tmp_path / f'replica_{n}.db'}" for n in range(len(replica_versions))],
+        "TASK_CACHE_SIZE": 10
+    }
+
+
+# task 1 on the primary is "Primary title"; each replica lags behind by a
+# different amount and holds "Replica <n> title" instead
+@pytest.fixture
+def replicated_task(app, replica_versions):
+    insert = Task.__table__.insert()
+    db.session.execute(insert, {"title": "Primary title", "description": ""})
+    db.session.commit()
+
+    for n, version in enumerate(replica_versions):
+        replica = db.get_engine(app, bind=f"replica_{n}")
+        db.Model.metadata.create_all(replica)
+        replica.execute(insert, {"title": f"Replica {n} title", "description": "",
+                                 "list_version": version})
+        replica.execute(ChangeCounter.__table__.insert(), {"name": "task", "value": version})
+
+
+def test_get_task_reads_from_replica(app, client, replicated_task):
+    # Act
+    response = client.get("/tasks/1")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.get_json()["task"]["title"] == "Replica 0 title"
+
+
+def test_get_tasks_reads_from_replica(app, client, replicated_task):
+    # Act
+    response = client.get("/tasks")
+
+    # Assert
+    assert [task["title"] for task in response.get_json()] == ["Replica 0 title"]
+
+
+def test_mark_complete_reads_and_writes_primary(app, client, replicated_task):
+    # Act
+    response = client.patch("/tasks/1/mark_complete")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.get_json()["task"]["title"] == "Primary title"
+    assert Task.query.get(1).completed_at is not None
+
+
+def test_stale_replica_is_skipped(app, client, replicated_task):
+    # Arrange
+    replicas = app.extensions["replicas"]
+    replicas.max_lag = 1
+    replicas.lag = lambda key, engine: 30
+
+    # Act
+    response = client.get("/tasks/1")
+
+    # Assert
+    assert response.get_json()["task"]["title"] == "Primary title"
+
+
+@pytest.mark.parametrize("replica_versions", [[1, 2]])
+def test_one_replica_per_request(client, replicated_task):
+    # Act
+    responses = [client.get("/tasks/changes").get_json() for _ in range(4)]
+
+    # Assert
+    # the counter and the rows it versions come from the same replica
+    seen = {(body["version"], body["tasks"][0]["title"]) for body in responses}
+    assert seen == {(1, "Replica 0 title"), (2, "Replica 1 title")}
+
+
+def test_replica_reads_are_not_cached(app, client, replicated_task):
+    # Act
+    client.get("/tasks/1")
+
+    # Assert
+    assert app.extensions["task_cache"].get(1) is None
+
+
+@pytest.mark.parametrize("replica_versions", [[]])
+def test_routing_off_without_replicas(client, one_task):
+    # Act
+    response = client.get("/tasks/1")
+
+    # Assert
+    assert response.status_code == 200
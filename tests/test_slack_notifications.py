@@ -0,0 +1,157 @@
+import time
+
+import pytest
+from app import db
+from app.models.task import Task
+from app.notifications import SlackNotifier
+
+
+@pytest.fixture
+def app_config(slack):
+    return {
+        "SLACK_BOT_TOKEN": "xoxb-test",
+        "SLACK_API_URL": slack.url,
+        "NOTIFY_RETRY_BACKOFF": 0.01
+    }
+
+
+@pytest.fixture
+def my_beautiful_task(app):
+    db.session.add(Task(title="My Beautiful Task", description="", completed_at=None))
+    db.session.commit()
+
+
+def test_mark_complete_sends_slack_message(app, client, slack, my_beautiful_task):
+    # Act
+    response = client.patch("/tasks/1/mark_complete")
+    notifier = app.extensions["notifier"]
+    notifier.flush(timeout=5)
+
+    # Assert
+    assert response.status_code == 200
+    assert slack.requests == [{
+        "authorization": "Bearer xoxb-test",
+        "body": {
+            "channel": "task-notifications",
+            "text": "Someone just completed the task My Beautiful Task"
+        }
+    }]
+    assert notifier.stats()["sent"] == 1
+
+
+def test_mark_complete_does_not_wait_for_slack(app, client, slack, my_beautiful_task):
+    # Arrange
+    slack.delay = 1
+
+    # Act
+    start = time.monotonic()
+    response = client.patch("/tasks/1/mark_complete")
+    elapsed = time.monotonic() - start
+
+    # Assert
+    assert response.status_code == 200
+    assert elapsed < 0.5
+    app.extensions["notifier"].flush(timeout=5)
+
+
+def test_mark_incomplete_sends_no_slack_message(app, client, slack, my_beautiful_task):
+    # Act
+    client.patch("/tasks/1/mark_incomplete")
+    app.extensions["notifier"].flush(timeout=5)
+
+    # Assert
+    assert slack.requests == []
+
+
+def test_notifier_retries_server_errors(slack):
+    # Arrange
+    slack.statuses = [500, 503]
+    notifier = SlackNotifier("xoxb-test", "task-notifications", slack.url,
+                             retry_backoff=0.01)
+
+    # Act
+    notifier.notify("Someone just completed the task My Beautiful Task")
+    notifier.flush(timeout=5)
+
+    # Assert
+    assert len(slack.requests) == 3
+    assert notifier.stats()["sent"] == 1
+    assert notifier.stats()["retried"] == 2
+
+
+def test_notifier_gives_up_on_rejected_message(slack):
+    # Arrange
+    slack.statuses = [400]
+    notifier = SlackNotifier("xoxb-test", "task-notifications", slack.url,
+                             retry_backoff=0.01)
+
+    # Act
+    notifier.notify("Someone just completed the task My Beautiful Task")
+    notifier.flush(timeout=5)
+
+    # Assert
+    assert len(slack.requests) == 1
+    assert notifier.stats()["failed"] == 1
+
+
+def test_notifier_fails_on_response_that_is_not_json(slack):
+    # Arrange
+    slack.bodies = [b"<html>Bad gateway</html>"]
+    notifier = SlackNotifier("xoxb-test", "task-notifications", slack.url,
+                             workers=1, batch_size=1, retry_backoff=0.01)
+
+    # Act
+    notifier.notify("Someone just completed the task My Beautiful Task")
+    notifier.flush(timeout=5)
+    notifier.notify("Someone just completed the task Water the garden 🌷")
+    notifier.flush(timeout=5)
+
+    # Assert
+    assert len(slack.requests) == 2
+    assert notifier.stats()["failed"] == 1
+    assert notifier.stats()["sent"] == 1
+
+
+def test_notifier_batches_queued_messages(slack):
+    # Arrange
+    notifier = SlackNotifier("xoxb-test", "task-notifications", slack.url,
+                             workers=1, batch_size=10)
+    slack.delay = 0.2
+    notifier.notify("first")
+
+    # Act
+    time.sleep(0.05)
+    for text in ("second", "third"):
+        notifier.notify(text)
+    notifier.flush(timeout=5)
+
+    # Assert
+    assert [request["body"]["text"] for request in slack.requests] == [
+        "first", "second\nthird"]
+
+
+def test_notifier_drops_when_queue_full(slack):
+    # Arrange
+    notifier = SlackNotifier("xoxb-test", "task-notifications", slack.url,
+                             queue_size=1, workers=1, batch_size=1)
+    slack.delay = 0.3
+
+    # Act
+    results = [notifier.notify(f"message {number}") for number in range(4)]
+    notifier.flush(timeout=5)
+
+    # Assert
+    assert False in results
+    assert notifier.stats()["dropped"] == results.count(False)
+
+
+def test_notifier_disabled_without_token(slack):
+    # Arrange
+    notifier = SlackNotifier(None, "task-notifications", slack.url)
+
+    # Act
+    queued = notifier.notify("Someone just completed the task My Beautiful Task")
+
+    # Assert
+    assert queued is False
+    assert slack.requests == []
@@ -0,0 +1,59 @@
+from app.models.task import Task
+
+
+def test_create_tasks_bulk(client):
+    # Act
+    response = client.post("/tasks/bulk", json=[
+        {"title": "First Task", "description": "First Description"},
+        {"title": "Second Task", "description": "Second Description",
+         "completed_at": "2022-05-01T09:30:00"},
+    ])
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 201
+    assert response_body == {"task_ids": [1, 2]}
+    tasks = Task.query.order_by(Task.task_id).all()
+    assert [task.title for task in tasks] == ["First Task", "Second Task"]
+    assert tasks[0].completed_at is None
+    assert tasks[1].completed_at is not None
+
+
+def test_create_tasks_bulk_invalid_task_creates_nothing(client):
+    # Act
+    response = client.post("/tasks/bulk", json=[
+        {"title": "First Task", "description": "First Description"},
+        {"title": "Missing Description"},
+    ])
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {"details": "Invalid data for task at index 1"}
+    assert Task.query.all() == []
+
+
+def test_create_tasks_bulk_must_be_list(client):
+    # Act
+    response = client.post("/tasks/bulk", json={
+        "title": "A Brand New Task",
+        "description": "Test Description"
+    })
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
+
+
+def test_create_tasks_bulk_too_many(client):
+    # Act
+    response = client.post("/tasks/bulk", json=[
+        {"title": "Task", "description": ""} for _ in range(1001)
+    ])
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
+    assert Task.query.all() == []
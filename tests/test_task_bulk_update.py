@@ -0,0 +1,126 @@
+import pytest
+from app import db
+from app.models.task import Task
+from app.routes import MAX_BULK_SIZE
+
+
+def test_mark_complete_tasks_bulk(client, three_tasks):
+    # Act
+    response = client.patch("/tasks/bulk/mark_complete", json={
+        "task_ids": [3, 1, 7]
+    })
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == {"matched_ids": [1, 3], "missing_ids": [7]}
+    assert Task.query.get(1).completed_at
+    assert Task.query.get(2).completed_at is None
+    assert Task.query.get(3).completed_at
+
+
+def test_mark_incomplete_tasks_bulk_by_filter(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.patch("/tasks/bulk/mark_incomplete", json={
+        "filter": {"is_complete": True}
+    })
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == {"matched_ids": [1, 3]}
+    assert Task.query.filter(Task.completed_at.isnot(None)).count() == 0
+
+
+def test_delete_tasks_bulk(client, three_tasks):
+    # Act
+    response = client.delete("/tasks/bulk", json={"task_ids": [2, 5]})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == {"matched_ids": [2], "missing_ids": [5]}
+    assert [task.task_id for task in Task.query.order_by(Task.task_id)] == [1, 3]
+
+
+def test_delete_tasks_bulk_empty_filter_deletes_all(client, three_tasks):
+    # Act
+    response = client.delete("/tasks/bulk", json={"filter": {}})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == {"matched_ids": [1, 2, 3]}
+    assert Task.query.all() == []
+
+
+def test_delete_tasks_bulk_invalid_ids(client, three_tasks):
+    # Act
+    response = client.delete("/tasks/bulk", json={"task_ids": [1, "two"]})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {
+        "details": "Invalid task id 'two'. Task id expected to be a number."
+    }
+    assert Task.query.count() == 3
+
+
+def test_mark_complete_tasks_bulk_missing_selection(client, three_tasks):
+    # Act
+    response = client.patch("/tasks/bulk/mark_complete", json={})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
+
+
+@pytest.mark.parametrize("bulk_filter", [
+    {"completed_after": 5},
+    {"completed_before": ["2022-05-01"]},
+    {"title_prefix": 5},
+    {"is_complete": 1},
+])
+def test_delete_tasks_bulk_invalid_filter_value(client, three_tasks, bulk_filter):
+    # Act
+    response = client.delete("/tasks/bulk", json={"filter": bulk_filter})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
+    assert Task.query.count() == 3
+
+
+def test_delete_tasks_bulk_unknown_filter(client, three_tasks):
+    # Act
+    response = client.delete("/tasks/bulk", json={"filter": {"bogus": 1}})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {
+        "details": "Unknown filter 'bogus'. Expected one of is_complete, title_prefix, completed_after, completed_before."
+    }
+    assert Task.query.count() == 3
+
+
+def test_mark_complete_tasks_bulk_filter_over_limit(client, app):
+    # Arrange
+    db.session.execute(Task.__table__.insert(), [
+        {"title": f"Task {number}", "description": "", "version": 1}
+        for number in range(MAX_BULK_SIZE + 1)])
+    db.session.commit()
+
+    # Act
+    response = client.patch("/tasks/bulk/mark_complete", json={"filter": {}})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {
+        "details": "Filter matches more than 1000 tasks. Narrow the filter or send task_ids in batches of at most 1000."
+    }
+    assert Task.query.filter(Task.completed_at.isnot(None)).count() == 0
@@ -0,0 +1,67 @@
+import pytest
+
+
+@pytest.fixture
+def app_config():
+    return {"TASK_CACHE_SIZE": 2}
+
+
+def cache_stats(app):
+    return app.extensions["task_cache"].stats()
+
+
+def test_get_task_cache_hit(app, client, three_tasks):
+    # Act
+    first = client.get("/tasks/1")
+    second = client.get("/tasks/1")
+
+    # Assert
+    assert first.get_json() == second.get_json()
+    assert cache_stats(app) == {
+        "size": 1, "max_size": 2, "hits": 1, "misses": 1}
+
+
+def test_get_task_cache_invalidated_by_update(client, three_tasks):
+    # Arrange
+    client.get("/tasks/1")
+
+    # Act
+    client.patch("/tasks/1/mark_complete")
+    response = client.get("/tasks/1")
+
+    # Assert
+    assert response.get_json()["task"]["is_complete"] is True
+
+
+def test_get_task_cache_invalidated_by_bulk_delete(client, three_tasks):
+    # Arrange
+    client.get("/tasks/2")
+
+    # Act
+    client.delete("/tasks/bulk", json={"task_ids": [2]})
+    response = client.get("/tasks/2")
+
+    # Assert
+    assert response.status_code == 404
+
+
+def test_get_task_cache_evicts_least_recently_used(app, client, three_tasks):
+    # Act
+    for task_id in (1, 2, 1, 3, 1, 2):
+        client.get(f"/tasks/{task_id}")
+
+    # Assert
+    stats = cache_stats(app)
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 4
+
+
+@pytest.mark.parametrize("app_config", [{}])
+def test_get_task_cache_disabled_by_default(app, client, one_task):
+    # Act
+    client.get("/tasks/1")
+    client.get("/tasks/1")
+
+    # Assert
+    assert cache_stats(app)["hits"] == 0
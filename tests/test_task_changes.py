@@ -0,0 +1,95 @@
+def test_get_task_changes_without_since_returns_everything(client, three_tasks):
+    # Act
+    response = client.get("/tasks/changes")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body["full"] is True
+    assert [task["id"] for task in response_body["tasks"]] == [1, 2, 3]
+    assert response_body["deleted_ids"] == []
+
+
+def test_get_task_changes_since_version(client, three_tasks):
+    # Arrange
+    client.post("/tasks", json={"title": "New", "description": ""})
+    version = client.get("/tasks/changes").get_json()["version"]
+    client.patch("/tasks/2/mark_complete")
+    client.post("/tasks", json={"title": "Newer", "description": ""})
+
+    # Act
+    response = client.get(f"/tasks/changes?since={version}")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body["full"] is False
+    assert response_body["version"] == version + 2
+    assert response_body["tasks"] == [
+        {"id": 2, "title": "Answer forgotten email 📧", "description": "", "is_complete": True},
+        {"id": 5, "title": "Newer", "description": "", "is_complete": False}
+    ]
+    assert response_body["deleted_ids"] == []
+
+
+def test_get_task_changes_reports_deleted_tasks(client, three_tasks):
+    # Arrange
+    client.post("/tasks", json={"title": "New", "description": ""})
+    version = client.get("/tasks/changes").get_json()["version"]
+    client.delete("/tasks/1")
+    client.delete("/tasks/bulk", json={"task_ids": [2, 3]})
+
+    # Act
+    response_body = client.get(f"/tasks/changes?since={version}").get_json()
+
+    # Assert
+    assert response_body["tasks"] == []
+    assert response_body["deleted_ids"] == [1, 2, 3]
+
+
+def test_get_task_changes_includes_goal_assignment(client, three_tasks, one_goal):
+    # Arrange
+    client.post("/tasks", json={"title": "New", "description": ""})
+    version = client.get("/tasks/changes").get_json()["version"]
+    client.post("/goals/1/tasks", json={"task_ids": [3]})
+
+    # Act
+    response_body = client.get(f"/tasks/changes?since={version}").get_json()
+
+    # Assert
+    assert [task["id"] for task in response_body["tasks"]] == [3]
+
+
+def test_get_task_changes_nothing_changed(client, three_tasks):
+    # Arrange
+    client.post("/tasks", json={"title": "New", "description": ""})
+    version = client.get("/tasks/changes").get_json()["version"]
+    client.patch("/tasks/bulk/mark_complete", json={"task_ids": [99]})
+
+    # Act
+    response_body = client.get(f"/tasks/changes?since={version}").get_json()
+
+    # Assert
+    assert response_body["version"] == version
+    assert response_body["tasks"] == []
+
+
+def test_get_task_changes_since_future_version_is_full(client, three_tasks):
+    # Act
+    response_body = client.get("/tasks/changes?since=1000").get_json()
+
+    # Assert
+    assert response_body["full"] is True
+    assert len(response_body["tasks"]) == 3
+
+
+def test_get_task_changes_invalid_since(client):
+    # Act
+    response = client.get("/tasks/changes?since=yesterday")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {
+        "details": "Invalid since 'yesterday'. Expected a version from a previous response."
+    }
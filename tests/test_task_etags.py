@@ -0,0 +1,87 @@
+def test_get_task_not_modified(client, one_task):
+    # Arrange
+    etag = client.get("/tasks/1").headers["ETag"]
+
+    # Act
+    response = client.get("/tasks/1", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_get_task_etag_changes_after_update(client, one_task):
+    # Arrange
+    etag = client.get("/tasks/1").headers["ETag"]
+    client.patch("/tasks/1/mark_complete")
+
+    # Act
+    response = client.get("/tasks/1", headers={"If-None-Match": etag})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response_body["task"]["is_complete"] is True
+
+
+def test_get_task_not_found_with_if_none_match(client):
+    # Act
+    response = client.get("/tasks/1", headers={"If-None-Match": '"task-1-1"'})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 404
+    assert response_body == {"details": "No task with id '1' found."}
+
+
+def test_get_tasks_not_modified(client, three_tasks):
+    # Arrange
+    etag = client.get("/tasks").headers["ETag"]
+
+    # Act
+    response = client.get("/tasks", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.get_data() == b""
+
+
+def test_get_tasks_etag_changes_after_create(client, three_tasks):
+    # Arrange
+    etag = client.get("/tasks").headers["ETag"]
+    client.post("/tasks", json={
+        "title": "A Brand New Task",
+        "description": "Test Description",
+    })
+
+    # Act
+    response = client.get("/tasks", headers={"If-None-Match": etag})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert len(response_body) == 4
+
+
+def test_get_tasks_etag_differs_by_query(client, three_tasks):
+    # Act
+    unsorted = client.get("/tasks").headers["ETag"]
+    sorted_asc = client.get("/tasks?sort=asc").headers["ETag"]
+
+    # Assert
+    assert unsorted != sorted_asc
+
+
+def test_get_tasks_etag_changes_after_bulk_delete(client, three_tasks):
+    # Arrange
+    etag = client.get("/tasks").headers["ETag"]
+    client.delete("/tasks/bulk", json={"task_ids": [1]})
+
+    # Act
+    response = client.get("/tasks", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 200
+    assert len(response.get_json()) == 2
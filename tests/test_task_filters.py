@@ -0,0 +1,111 @@
+import pytest
+
+
+def test_get_tasks_is_complete_true(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.get("/tasks?is_complete=true")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["id"] for task in response_body] == [1, 3]
+    assert all(task["is_complete"] for task in response_body)
+
+
+def test_get_tasks_is_complete_false(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.get("/tasks?is_complete=false")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == [
+        {
+            "id": 2,
+            "title": "Answer forgotten email 📧",
+            "description": "",
+            "is_complete": False
+        }
+    ]
+
+
+def test_get_tasks_title_prefix_sorted(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.get("/tasks?title_prefix=W&sort=desc")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["title"] for task in response_body] == [
+        "Water the garden 🌷",
+        "Walk the dog 🐕"
+    ]
+
+
+@pytest.mark.parametrize("title_prefix, expected_ids", [
+    ("Wa", [1, 3]),
+    ("Water the garden 🌷", [1]),
+    ("w", []),
+    ("Answer", [2]),
+])
+def test_get_tasks_title_prefix_matches(client, completed_and_incomplete_tasks,
+                                        title_prefix, expected_ids):
+    # Act
+    response = client.get("/tasks", query_string={"title_prefix": title_prefix})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["id"] for task in response_body] == expected_ids
+
+
+def test_get_tasks_title_prefix_is_literal(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.get("/tasks?title_prefix=%25")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == []
+
+
+def test_get_tasks_completed_date_range(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.get(
+        "/tasks?completed_after=2022-05-02&completed_before=2022-05-04T00:00:00Z")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["id"] for task in response_body] == [3]
+
+
+def test_get_tasks_filters_with_pagination(client, completed_and_incomplete_tasks):
+    # Act
+    response = client.get("/tasks?is_complete=true&limit=1")
+    response_body = response.get_json()
+    next_page = client.get("/tasks", query_string={
+        "is_complete": "true",
+        "limit": 1,
+        "cursor": response_body["next_cursor"]
+    }).get_json()
+
+    # Assert
+    assert [task["id"] for task in response_body["tasks"]] == [1]
+    assert [task["id"] for task in next_page["tasks"]] == [3]
+    assert next_page["next_cursor"] is None
+
+
+@pytest.mark.parametrize("query", [
+    "is_complete=maybe",
+    "completed_after=yesterday",
+    "completed_before=2022-13-01",
+])
+def test_get_tasks_invalid_filter(client, query):
+    # Act
+    response = client.get(f"/tasks?{query}")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
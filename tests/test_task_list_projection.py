@@ -0,0 +1,25 @@
+def test_get_tasks_reports_completed_task(client, completed_task):
+    # Act
+    response = client.get("/tasks")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == [
+        {
+            "id": 1,
+            "title": "Go on my daily walk 🏞",
+            "description": "Notice something new every day",
+            "is_complete": True
+        }
+    ]
+
+
+def test_get_tasks_page_reports_completed_task(client, completed_task):
+    # Act
+    response = client.get("/tasks?limit=5")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body["tasks"][0]["is_complete"] is True
@@ -0,0 +1,174 @@
+import base64
+import json
+import pytest
+from sqlalchemy import text
+from app import db
+from app.models.task import Task
+from app.routes import order_tasks, page_queries, task_rows
+
+
+def test_get_tasks_first_page(client, three_tasks):
+    # Act
+    response = client.get("/tasks?limit=2")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["id"] for task in response_body["tasks"]] == [1, 2]
+    assert response_body["next_cursor"]
+
+
+def test_get_tasks_follow_cursor_to_last_page(client, three_tasks):
+    # Arrange
+    first_page = client.get("/tasks?limit=2").get_json()
+
+    # Act
+    response = client.get(
+        "/tasks", query_string={"limit": 2, "cursor": first_page["next_cursor"]})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == {
+        "tasks": [
+            {
+                "id": 3,
+                "title": "Pay my outstanding tickets 😭",
+                "description": "",
+                "is_complete": False
+            }
+        ],
+        "next_cursor": None
+    }
+
+
+@pytest.mark.parametrize("sort, expected_titles", [
+    ("asc", ["Answer forgotten email 📧",
+             "Pay my outstanding tickets 😭",
+             "Water the garden 🌷"]),
+    ("desc", ["Water the garden 🌷",
+              "Pay my outstanding tickets 😭",
+              "Answer forgotten email 📧"]),
+])
+def test_get_tasks_sorted_pages(client, three_tasks, sort, expected_titles):
+    # Act
+    titles = []
+    query = {"limit": 1, "sort": sort}
+    while True:
+        response_body = client.get("/tasks", query_string=query).get_json()
+        titles.extend(task["title"] for task in response_body["tasks"])
+        if response_body["next_cursor"] is None:
+            break
+        query["cursor"] = response_body["next_cursor"]
+
+    # Assert
+    assert titles == expected_titles
+
+
+@pytest.mark.parametrize("limit", [1, 3])
+@pytest.mark.parametrize("sort, expected_titles", [
+    ("asc", ["Answer forgotten email 📧", "Water the garden 🌷", None, None]),
+    ("desc", [None, None, "Water the garden 🌷", "Answer forgotten email 📧"]),
+])
+def test_get_tasks_sorted_pages_without_titles(client, app, sort, expected_titles, limit):
+    # Arrange
+    db.session.add_all([
+        Task(title=None, description=""),
+        Task(title="Water the garden 🌷", description=""),
+        Task(title=None, description=""),
+        Task(title="Answer forgotten email 📧", description="")
+    ])
+    db.session.commit()
+
+    # Act
+    titles = []
+    query = {"limit": limit, "sort": sort}
+    while True:
+        response_body = client.get("/tasks", query_string=query).get_json()
+        titles.extend(task["title"] for task in response_body["tasks"])
+        if response_body["next_cursor"] is None:
+            break
+        query["cursor"] = response_body["next_cursor"]
+
+    # Assert
+    assert titles == expected_titles
+
+
+@pytest.mark.parametrize("sort", ["asc", "desc"])
+@pytest.mark.parametrize("title", ["Pay my outstanding tickets 😭", None])
+def test_page_queries_seek_through_title_index(app, three_tasks, sort, title):
+    if db.engine.dialect.name != "sqlite":
+        pytest.skip("checks SQLite's query plan")
+
+    # Arrange
+    statements = [order_tasks(page_query, sort).limit(11).statement
+                  for page_query in page_queries(task_rows(), sort, [title, 2])]
+
+    # Act
+    plans = []
+    for statement in statements:
+        sql = str(statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+        rows = db.session.execute(text("EXPLAIN QUERY PLAN " + sql)).fetchall()
+        plans.append(" ".join(row[-1] for row in rows))
+
+    # Assert
+    assert plans
+    for plan in plans:
+        assert "SEARCH task USING" in plan and "ix_task_title_task_id" in plan
+        assert "TEMP B-TREE" not in plan
+
+
+def test_get_tasks_cursor_from_other_sort(client, three_tasks):
+    # Arrange
+    cursor = client.get("/tasks?limit=1&sort=asc").get_json()["next_cursor"]
+
+    # Act
+    response = client.get(
+        "/tasks", query_string={"limit": 1, "sort": "desc", "cursor": cursor})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
+
+
+def test_get_tasks_invalid_cursor(client, three_tasks):
+    # Act
+    response = client.get("/tasks?limit=1&cursor=not-a-cursor")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {"details": "Invalid cursor 'not-a-cursor'."}
+
+
+@pytest.mark.parametrize("payload", [
+    {"sort": "id", "key": [{}]},
+    {"sort": "id", "key": [True]},
+    {"sort": "asc", "key": 5},
+    {"sort": "asc", "key": [5, 1]},
+    {"sort": "asc", "key": ["Title", "1"]},
+])
+def test_get_tasks_cursor_with_invalid_key(client, three_tasks, payload):
+    # Arrange
+    cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    # Act
+    response = client.get(
+        "/tasks", query_string={"limit": 1, "sort": payload["sort"], "cursor": cursor})
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
+
+
+@pytest.mark.parametrize("limit", ["abc", "0", "1001"])
+def test_get_tasks_invalid_limit(client, limit):
+    # Act
+    response = client.get(f"/tasks?limit={limit}")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert "details" in response_body
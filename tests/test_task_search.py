@@ -0,0 +1,95 @@
+import base64
+import pytest
+from app import db
+from app.models.task import Task
+
+
+@pytest.fixture
+def searchable_tasks(app):
+    db.session.add_all([
+        Task(title="Water the garden", description="Roses need water every morning"),
+        Task(title="Answer forgotten email", description="Reply about the garden party"),
+        Task(title="Pay my outstanding tickets", description=""),
+        Task(title="Garden garden garden", description="Weed the garden beds"),
+    ])
+    db.session.commit()
+
+
+def test_search_tasks_ranks_matches(client, searchable_tasks):
+    # Act
+    response = client.get("/tasks/search?q=garden")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert [task["id"] for task in response_body["tasks"]] == [4, 1, 2]
+    assert response_body["tasks"][0] == {
+        "id": 4, "title": "Garden garden garden",
+        "description": "Weed the garden beds", "is_complete": False
+    }
+    assert response_body["next_cursor"] is None
+
+
+def test_search_tasks_matches_every_word(client, searchable_tasks):
+    # Act
+    response_body = client.get("/tasks/search?q=garden party").get_json()
+
+    # Assert
+    assert [task["id"] for task in response_body["tasks"]] == [2]
+
+
+def test_search_tasks_paginates(client, searchable_tasks):
+    # Arrange
+    first = client.get("/tasks/search?q=garden&limit=2").get_json()
+
+    # Act
+    second = client.get(f"/tasks/search?q=garden&limit=2&cursor={first['next_cursor']}").get_json()
+
+    # Assert
+    assert [task["id"] for task in first["tasks"]] == [4, 1]
+    assert [task["id"] for task in second["tasks"]] == [2]
+    assert second["next_cursor"] is None
+
+
+def test_search_tasks_follows_updates_and_deletes(client, searchable_tasks):
+    # Arrange
+    client.put("/tasks/3", json={"title": "Buy garden hose", "description": ""})
+    client.delete("/tasks/1")
+
+    # Act
+    response_body = client.get("/tasks/search?q=garden").get_json()
+
+    # Assert
+    assert sorted(task["id"] for task in response_body["tasks"]) == [2, 3, 4]
+
+
+def test_search_tasks_treats_operators_as_text(client, searchable_tasks):
+    # Act
+    response = client.get('/tasks/search?q=garden" OR "tickets*')
+
+    # Assert
+    assert response.status_code == 200
+    assert response.get_json()["tasks"] == []
+
+
+def test_search_tasks_requires_query(client):
+    # Act
+    response = client.get("/tasks/search?q=%20")
+
+    # Assert
+    assert response.status_code == 400
+    assert response.get_json() == {"details": "Search requires a non-empty q parameter"}
+
+
+def test_search_tasks_invalid_cursor(client):
+    # Arrange
+    cursor = base64.urlsafe_b64encode(b'{"sort": "id", "key": [1]}').decode()
+
+    # Act
+    response = client.get(f"/tasks/search?q=garden&cursor={cursor}")
+
+    # Assert
+    assert response.status_code == 400
+    assert response.get_json() == {
+        "details": f"Cursor '{cursor}' does not match the requested sort."
+    }
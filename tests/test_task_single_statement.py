@@ -0,0 +1,46 @@
+import pytest
+from app.models.task import Task
+
+
+@pytest.mark.parametrize("method, path", [
+    ("put", "/tasks/abc"),
+    ("delete", "/tasks/abc"),
+    ("patch", "/tasks/abc/mark_complete"),
+    ("patch", "/tasks/abc/mark_incomplete"),
+])
+def test_mutating_routes_invalid_task_id(client, one_task, method, path):
+    # Act
+    response = getattr(client, method)(path, json={
+        "title": "Updated Task Title",
+        "description": "Updated Test Description",
+    })
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 400
+    assert response_body == {
+        "details": "Invalid task id 'abc'. Task id expected to be a number."
+    }
+
+
+def test_update_task_keeps_completed_at(client, completed_task):
+    # Act
+    response = client.put("/tasks/1", json={
+        "title": "Updated Task Title",
+        "description": "Updated Test Description",
+    })
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body["task"]["is_complete"] is True
+    assert Task.query.get(1).completed_at
+
+
+def test_update_task_missing_fields_changes_nothing(client, one_task):
+    # Act
+    response = client.put("/tasks/1", json={"title": "Updated Task Title"})
+
+    # Assert
+    assert response.status_code == 400
+    assert Task.query.get(1).title == "Go on my daily walk 🏞"
@@ -0,0 +1,38 @@
+import json
+
+
+def test_get_tasks_stream_json_array(client, three_tasks):
+    # Act
+    response = client.get("/tasks?stream=1")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert [task["id"] for task in response_body] == [1, 2, 3]
+
+
+def test_get_tasks_stream_no_saved_tasks(client):
+    # Act
+    response = client.get("/tasks?stream=1")
+    response_body = response.get_json()
+
+    # Assert
+    assert response.status_code == 200
+    assert response_body == []
+
+
+def test_get_tasks_stream_ndjson_sorted(client, three_tasks):
+    # Act
+    response = client.get(
+        "/tasks?sort=desc", headers={"Accept": "application/x-ndjson"})
+    lines = response.get_data(as_text=True).splitlines()
+
+    # Assert
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [json.loads(line)["title"] for line in lines] == [
+        "Water the garden 🌷",
+        "Pay my outstanding tickets 😭",
+        "Answer forgotten email 📧"
+    ]